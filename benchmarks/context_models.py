@@ -0,0 +1,73 @@
+""" Benchmark of context models building from ORM objects.
+
+Slotted context models are compared with pydantic models made by `sqlalchemy_to_pydantic`, which were used before:
+CPU time of `from_orm` for participant with loaded user and challenge, and memory held by built objects.
+
+Run from the repository root:
+
+    python -m benchmarks.context_models [runs]
+"""
+import datetime
+import functools
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from pydantic_sqlalchemy import sqlalchemy_to_pydantic
+from quiz_bot import db
+from quiz_bot.entity import ContextParticipant
+
+_HELD_OBJECTS = 1000
+
+
+class PydanticUser(sqlalchemy_to_pydantic(db.User)):  # type: ignore
+    pass
+
+
+class PydanticChallenge(sqlalchemy_to_pydantic(db.Challenge)):  # type: ignore
+    pass
+
+
+class PydanticParticipant(sqlalchemy_to_pydantic(db.Participant)):  # type: ignore
+    user: PydanticUser
+    challenge: PydanticChallenge
+
+
+def make_participant() -> db.Participant:
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    user = db.User(
+        external_id=1, remote_chat_id=1, chitchat_id='chitchat', first_name='Name', last_name=None, nick_name='nick'
+    )
+    user.id, user.created_at = 1, now
+    challenge = db.Challenge(name='challenge', phase_amount=5, winner_amount=3, duration=datetime.timedelta(days=1))
+    challenge.id, challenge.created_at = 1, now
+    participant = db.Participant(user_id=user.id, challenge_id=challenge.id)
+    participant.id, participant.created_at, participant.current_phase = 1, now, 1
+    participant.user, participant.challenge = user, challenge
+    return participant
+
+
+def measure_memory(build: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    held: List[Any] = [build() for _ in range(_HELD_OBJECTS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size / _HELD_OBJECTS
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    participant = make_participant()
+    print(f"Participant with user and challenge, from_orm {runs} runs:")
+    results = {}
+    for name, model in (('pydantic', PydanticParticipant), ('slotted', ContextParticipant)):
+        build = functools.partial(model.from_orm, participant)
+        results[name] = timeit.timeit(build, number=runs) / runs
+        print(f"  {name:>8}: {results[name] * 1e6:.1f} us per call, {measure_memory(build) / 1024:.2f} KB per object")
+    print(f"  slotted models are built {results['pydantic'] / results['slotted']:.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
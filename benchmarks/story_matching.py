@@ -0,0 +1,71 @@
+""" Microbenchmark of story answers matching on large stories.
+
+Compiled `StoryMatcher` is compared with reference matching, which builds and searches patterns of every line
+element for every check, as `StoryResultChecker` did before matchers were compiled.
+
+Run from the repository root:
+
+    python -m benchmarks.story_matching [lines] [runs]
+"""
+import re
+import sys
+import timeit
+from typing import List, Sequence
+
+from quiz_bot.entity import StoryItem, StoryPatternValue, SymbolReplacementSettings
+from quiz_bot.quiz.checkers.matching import TextNormalizer
+from quiz_bot.quiz.checkers.story_checker import StoryMatcher
+
+NICK_NAME = 'benchmark_user'
+_USERNAME_PATTERN = re.compile(r"({%s})+" % StoryPatternValue.USERNAME.value)
+
+
+def make_items(lines: int) -> List[StoryItem]:
+    steps = ["Дано", "Когда|И", "То|Но"]
+    return [
+        StoryItem(step=steps[i % 3], construction=f"конструкция {i}", text=f"{{username}} делает шаг {i}")
+        for i in range(lines)
+    ]
+
+
+def make_answer(items: Sequence[StoryItem]) -> List[str]:
+    return [
+        f"{item.step.value} конструкция {i} и {NICK_NAME} делает шаг {i}".lower() for i, item in enumerate(items)
+    ]
+
+
+def reference_match(items: Sequence[StoryItem], lines: Sequence[str], normalizer: TextNormalizer) -> bool:
+    def search(answer: str, expectation: str) -> bool:
+        answer = normalizer.replace_symbols(answer)
+        expectation = normalizer.replace_symbols(expectation)
+        return re.search(rf"({expectation})+", answer, re.I) is not None
+
+    for item, line in zip(items, lines):
+        text = _USERNAME_PATTERN.sub(NICK_NAME, item.text)
+        if not (
+            (search(line, item.step.value) or any(search(line, x.value) for x in item.iterable_prepositions))
+            and search(line, item.construction)
+            and search(line, text)
+        ):
+            return False
+    return True
+
+
+def main() -> None:
+    lines_amount = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    normalizer = TextNormalizer(SymbolReplacementSettings().mapping)
+    items = make_items(lines_amount)
+    lines = [normalizer.replace_symbols(x) for x in make_answer(items)]
+    matcher = StoryMatcher(items, normalizer)
+    assert matcher.match(lines, NICK_NAME) and reference_match(items, lines, normalizer)
+
+    reference = timeit.timeit(lambda: reference_match(items, lines, normalizer), number=runs) / runs
+    compiled = timeit.timeit(lambda: matcher.match(lines, NICK_NAME), number=runs) / runs
+    print(f"Story of {lines_amount} lines, {runs} runs:")
+    print(f"  reference matching: {reference * 1e3:.2f} ms per check")
+    print(f"  compiled matcher:   {compiled * 1e3:.2f} ms per check ({reference / compiled:.1f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
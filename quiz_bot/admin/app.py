@@ -1,9 +1,9 @@
+import http
 import logging
-import os
 from pathlib import Path
 from typing import Optional, cast
 
-from flask import Flask, Response, render_template, request, send_from_directory
+from flask import Flask, Response, render_template, request
 from quiz_bot import db
 from quiz_bot.admin.cloud import CloudMaker
 from quiz_bot.admin.flask import get_flask_app
@@ -15,10 +15,6 @@ logger = logging.getLogger(__name__)
 def quizbot_app(cloud_maker: CloudMaker, statistics_collector: StatisticsCollector) -> Flask:
     admin_folder = Path(__file__).parent
     template_folder = admin_folder / "templates"
-    static_folder = admin_folder / "files"
-
-    if not static_folder.exists():
-        os.makedirs(static_folder.as_posix())
 
     flask_app = get_flask_app(template_folder.as_posix())
 
@@ -28,17 +24,22 @@ def quizbot_app(cloud_maker: CloudMaker, statistics_collector: StatisticsCollect
 
     @flask_app.route('/')
     def index() -> str:
-        picture_name = cloud_maker.save_cloud(static_folder)
         return render_template(
             "index.html",
             page_name="T-Quiz Bot Overview",
-            picture_name=picture_name,
+            picture=cloud_maker.picture,
             statistics=statistics_collector.statistics,
         )
 
-    @flask_app.route('/files/<path:file>')
-    def get_file(file: str) -> Response:
-        return cast(Response, send_from_directory(static_folder.as_posix(), file))
+    @flask_app.route('/cloud.jpg')
+    def get_cloud() -> Response:
+        picture = cloud_maker.picture
+        if picture is None:
+            return Response(status=http.HTTPStatus.NOT_FOUND)
+        response = Response(picture.data, mimetype='image/jpeg')
+        response.set_etag(picture.etag)
+        response.cache_control.no_cache = True
+        return cast(Response, response.make_conditional(request))
 
     @flask_app.route('/left_time')
     def get_left_time() -> Response:
@@ -1,35 +1,82 @@
-from pathlib import Path
-from typing import Optional
-from uuid import uuid4
+import hashlib
+import io
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional
 
-import matplotlib.pyplot as plt
-from quiz_bot.storage import MessageStorage
+from quiz_bot.entity import CloudSource, MessageCloudSettings
+from quiz_bot.storage import IMessageStorage
 from wordcloud import WordCloud
 
-_JPG_FMT = "jpg"
+logger = logging.getLogger(__name__)
+
+_JPEG_FMT = "JPEG"
+_JPEG_QUALITY = 90
+# Forked child of multithreaded server could inherit locks held by other threads
+_MP_START_METHOD = 'spawn'
+
+
+@dataclass(frozen=True)
+class CloudPicture:
+    data: bytes
+    etag: str
+
+
+def render_cloud(wordcloud: WordCloud, frequencies: Dict[str, int]) -> bytes:
+    """ Render word cloud image straight to JPEG bytes, is called in worker process. """
+    image = wordcloud.generate_from_frequencies(frequencies).to_image()
+    buffer = io.BytesIO()
+    image.save(buffer, format=_JPEG_FMT, quality=_JPEG_QUALITY)
+    return buffer.getvalue()
 
 
 class CloudMaker:
-    def __init__(self, wordcloud: WordCloud, storage: MessageStorage):
-        self._wordcloud_factory = wordcloud
+    """ Renders word cloud from frequencies of words of all or recent messages in background process
+    when they change and keeps the last picture. """
+
+    def __init__(self, wordcloud: WordCloud, storage: IMessageStorage, settings: MessageCloudSettings):
+        self._wordcloud = wordcloud
         self._storage = storage
+        self._settings = settings
+        self._picture: Optional[CloudPicture] = None
+        self._frequencies: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def picture(self) -> Optional[CloudPicture]:
+        return self._picture
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._work, name='cloud-maker', daemon=True)
+        self._thread.start()
+
+    def _get_frequencies(self) -> Dict[str, int]:
+        if self._settings.cloud_source is CloudSource.RECENT:
+            return self._storage.recent_word_frequencies
+        return self._storage.word_frequencies
+
+    def refresh(self, executor: Executor) -> None:
+        frequencies = self._get_frequencies()
+        if frequencies == self._frequencies:
+            return
+        if not frequencies:
+            self._picture = None
+        else:
+            data = executor.submit(render_cloud, self._wordcloud, frequencies).result()
+            self._picture = CloudPicture(data=data, etag=hashlib.sha1(data).hexdigest())
+        self._frequencies = frequencies
 
-    @staticmethod
-    def _generate_picture_name() -> str:
-        return f"f{str(uuid4())}.{_JPG_FMT}"
-
-    def _make_cloud(self) -> Optional[WordCloud]:
-        texts = [message.text for message in self._storage.messages]
-        if texts:
-            return self._wordcloud_factory.generate(" ".join(texts))
-        return None
-
-    def save_cloud(self, folder: Path) -> Optional[str]:
-        picture_name = self._generate_picture_name()
-        cloud = self._make_cloud()
-        if cloud is not None:
-            plt.imshow(cloud, interpolation='bilinear')
-            plt.axis("off")
-            plt.savefig((folder / picture_name).as_posix(), format=_JPG_FMT, dpi=115)
-            return picture_name
-        return None
+    def _work(self) -> None:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context(_MP_START_METHOD)) as executor:
+            while True:
+                try:
+                    self.refresh(executor)
+                except Exception:
+                    logger.exception("Could not render word cloud!")
+                time.sleep(self._settings.refresh_interval)
@@ -1,13 +1,18 @@
 import datetime
 import logging
+import threading
 from typing import List, Optional
 
 from pydantic import BaseModel
 from quiz_bot import db
+from quiz_bot.entity import ContextChallenge, StatisticsSettings
 from quiz_bot.storage import IChallengeStorage, IParticipantStorage, IUserStorage
+from quiz_bot.utils import LRUCache
 
 logger = logging.getLogger(__name__)
 
+_STATISTICS_KEY = 'statistics'
+
 
 class ChallengeStatistics(BaseModel):
     number: int
@@ -22,41 +27,61 @@ class QuizStatistics(BaseModel):
     challenges: List[ChallengeStatistics]
 
 
+def _format_left_time(challenge: ContextChallenge) -> str:
+    if challenge.finished or challenge.out_of_date:
+        left_time = datetime.timedelta(seconds=0)
+    else:
+        left_time = challenge.finish_after
+    return str(left_time).split(".")[0]
+
+
 class StatisticsCollector:
+    """ Collects quiz statistics with one aggregated query for all challenges and keeps them for short time. """
+
     def __init__(
-        self, user_storage: IUserStorage, challenge_storage: IChallengeStorage, participant_storage: IParticipantStorage
+        self,
+        user_storage: IUserStorage,
+        challenge_storage: IChallengeStorage,
+        participant_storage: IParticipantStorage,
+        settings: StatisticsSettings,
     ):
         self._user_storage = user_storage
         self._challenge_storage = challenge_storage
         self._participant_storage = participant_storage
+        self._cache: LRUCache[str, QuizStatistics] = LRUCache(maxsize=1, ttl=settings.cache_ttl)
+        self._lock = threading.Lock()
 
     @property
     def statistics(self) -> QuizStatistics:
+        statistics = self._cache.get(_STATISTICS_KEY)
+        if statistics is not None:
+            return statistics
+        with self._lock:
+            statistics = self._cache.get(_STATISTICS_KEY)
+            if statistics is None:
+                statistics = self._collect()
+                self._cache.set(_STATISTICS_KEY, statistics)
+        return statistics
+
+    def _collect(self) -> QuizStatistics:
         with db.create_session() as session:
             users = self._user_storage.get_user_ids_amount(session)
-            challenges: List[ChallengeStatistics] = []
-            for challenge_id in self._challenge_storage.get_challenge_ids(session):
-                max_scores = self._participant_storage.get_max_scores(session, challenge_id=challenge_id) or 0
-                time_left = self.get_left_time(challenge_id)
-                if time_left is None:
-                    raise RuntimeError("Should not be there!")
-                statistics = ChallengeStatistics(
-                    number=challenge_id,
-                    participants=self._participant_storage.get_participants_amount(session, challenge_id=challenge_id),
-                    pretenders=self._participant_storage.get_pretenders_amount(session, challenge_id=challenge_id),
-                    max_scores=max_scores,
-                    time_left=time_left,
-                )
-                challenges.append(statistics)
-            return QuizStatistics(users=users, challenges=challenges)
+            summaries = self._participant_storage.get_challenge_summaries(session)
+        challenges = [
+            ChallengeStatistics(
+                number=summary.challenge.id,
+                participants=summary.participants,
+                pretenders=summary.pretenders,
+                max_scores=summary.max_scores or 0,
+                time_left=_format_left_time(summary.challenge),
+            )
+            for summary in summaries
+        ]
+        return QuizStatistics(users=users, challenges=challenges)
 
     def get_left_time(self, challenge_id: int) -> Optional[str]:
         challenge = self._challenge_storage.get_challenge(challenge_id)
         if challenge is None:
             logging.error("Challenge with ID '%s' not exists!", challenge_id)
             return None
-        if challenge.finished or challenge.out_of_date:
-            left_time = datetime.timedelta(seconds=0)
-        else:
-            left_time = challenge.finish_after
-        return str(left_time).split(".")[0]
+        return _format_left_time(challenge)
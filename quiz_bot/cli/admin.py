@@ -1,8 +1,9 @@
 import click
 from quiz_bot.admin import CloudMaker, StatisticsCollector
 from quiz_bot.cli.group import app
-from quiz_bot.entity import MessageCloudSettings
+from quiz_bot.entity import MessageCloudSettings, StatisticsSettings, UserStorageSettings
 from quiz_bot.storage import ChallengeStorage, MessageStorage, ParticipantStorage, UserStorage
+from werkzeug.serving import is_running_from_reloader
 from wordcloud import WordCloud
 
 
@@ -14,13 +15,21 @@ def admin(port: int, debug: bool) -> None:
     from quiz_bot.admin import quizbot_app, set_basic_settings
 
     set_basic_settings()
+    cloud_settings = MessageCloudSettings()
     cloud_maker = CloudMaker(
         wordcloud=WordCloud(background_color="white", width=1280, height=640),
-        storage=MessageStorage(MessageCloudSettings()),
+        storage=MessageStorage(cloud_settings),
+        settings=cloud_settings,
     )
     statistics_collector = StatisticsCollector(
-        user_storage=UserStorage(), challenge_storage=ChallengeStorage(), participant_storage=ParticipantStorage()
+        user_storage=UserStorage(UserStorageSettings()),
+        challenge_storage=ChallengeStorage(),
+        participant_storage=ParticipantStorage(),
+        settings=StatisticsSettings(),
     )
+    if not debug or is_running_from_reloader():
+        # With debug reloader admin panel is served by child process only
+        cloud_maker.start()
     quizbot_app(cloud_maker=cloud_maker, statistics_collector=statistics_collector).run(
         host='0.0.0.0', port=port, debug=debug
     )
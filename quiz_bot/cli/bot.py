@@ -4,15 +4,25 @@ from typing import Optional
 import click
 from quiz_bot.admin import set_basic_settings
 from quiz_bot.cli.group import app
-from quiz_bot.cli.utils import get_settings
+from quiz_bot.cli.utils import get_settings, handle_termination
 from quiz_bot.entity import ChallengeSettings, ShoutboxSettings
 from quiz_bot.factory import ChatFactory, QuizInterfaceFactory
+from quiz_bot.quiz.objects import RuntimeMode
 
 
 @app.command()
 @click.option('-challenges', '--challenge-settings-file', type=click.File('r'), help='Challenge settings JSON file')
 @click.option('-shoutbox', '--shoutbox-settings-file', type=click.File('r'), help='Shoutbox settings JSON file')
-def run(challenge_settings_file: Optional[io.StringIO], shoutbox_settings_file: Optional[io.StringIO]) -> None:
+@click.option(
+    '-mode',
+    '--runtime-mode',
+    type=click.Choice([x.value for x in RuntimeMode]),
+    default=RuntimeMode.THREADED.value,
+    help='Updates processing runtime',
+)
+def run(
+    challenge_settings_file: Optional[io.StringIO], shoutbox_settings_file: Optional[io.StringIO], runtime_mode: str
+) -> None:
     click.echo('Starting up QuizBot...')
     set_basic_settings()
     challenge_settings: ChallengeSettings = get_settings(
@@ -22,7 +32,16 @@ def run(challenge_settings_file: Optional[io.StringIO], shoutbox_settings_file:
         file=shoutbox_settings_file, settings_type=ShoutboxSettings  # type: ignore
     )
     factory = QuizInterfaceFactory(challenge_settings=challenge_settings, shoutbox_settings=shoutbox_settings)
-    factory.interface.run()
+    if factory.metrics_reporter is not None:
+        factory.metrics_reporter.start()
+    handle_termination()
+    try:
+        if RuntimeMode(runtime_mode) is RuntimeMode.ASYNC:
+            factory.async_interface.run()
+            return
+        factory.interface.run()
+    finally:
+        factory.close()
 
 
 @app.command()
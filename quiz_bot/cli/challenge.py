@@ -5,6 +5,7 @@ import click
 from quiz_bot.admin import set_basic_settings
 from quiz_bot.cli.group import app
 from quiz_bot.cli.utils import get_settings
+from quiz_bot.clients import BroadcastProgress
 from quiz_bot.entity import ChallengeSettings, ShoutboxSettings
 from quiz_bot.factory import QuizManagerFactory
 
@@ -17,6 +18,34 @@ def _get_management_factory(challenge_settings_file: Optional[io.StringIO]) -> Q
     return QuizManagerFactory(challenge_settings=challenge_settings, shoutbox_settings=ShoutboxSettings())
 
 
+class _ProgressPrinter:
+    def __init__(self) -> None:
+        self._previous = BroadcastProgress(submitted=0, sent=0, failed=0, blocked=0, elapsed=0.0)
+
+    def __call__(self, progress: BroadcastProgress) -> None:
+        period = max(progress.elapsed - self._previous.elapsed, 1e-3)
+        click.echo(
+            f"[{progress.elapsed:.0f}s] "
+            f"sent {progress.sent} ({(progress.sent - self._previous.sent) / period:.1f}/s), "
+            f"failed {progress.failed} ({(progress.failed - self._previous.failed) / period:.1f}/s), "
+            f"blocked {progress.blocked} ({(progress.blocked - self._previous.blocked) / period:.1f}/s), "
+            f"in progress {progress.submitted - progress.completed}"
+        )
+        self._previous = progress
+
+
+def _notify(factory: QuizManagerFactory, challenge_id: Optional[int], is_start: bool = False) -> None:
+    report = factory.notifier.notify(challenge_id, is_start=is_start, progress_callback=_ProgressPrinter())
+    click.echo(
+        f"Notification finished in {report.elapsed:.1f}s: sent {report.sent}, "
+        f"failed {len(report.failed_chat_ids)}, blocked {len(report.blocked_chat_ids)}."
+    )
+    if report.failed_chat_ids:
+        click.echo(f"Failed chat IDs: {', '.join(str(x) for x in report.failed_chat_ids)}")
+    if report.blocked_chat_ids:
+        click.echo(f"Chat IDs with blocked bot: {', '.join(str(x) for x in report.blocked_chat_ids)}")
+
+
 @app.group(short_help="Commands for challenge managment")
 def challenge() -> None:
     pass
@@ -31,8 +60,7 @@ def notification(challenge_settings_file: Optional[io.StringIO], challenge_id: O
     else:
         click.echo("Challenge ID not specified. Try to prepare notification for current challenge...")
     factory = _get_management_factory(challenge_settings_file)
-    factory.notifier.notify(challenge_id)
-    click.echo('Notification finished.')
+    _notify(factory, challenge_id)
 
 
 @challenge.command()
@@ -52,9 +80,7 @@ def start_next(challenge_settings_file: Optional[io.StringIO]) -> None:
 
     if previous_number is not None:
         click.echo(f"Previous challenge with ID {previous_number} exists, so need to notify players.")
-        factory.notifier.notify(previous_number)
-        click.echo('Notification finished.')
+        _notify(factory, previous_number)
 
     click.echo(f"Notify players about next challenge with ID {next_number}...")
-    factory.notifier.notify(next_number, is_start=True)
-    click.echo('Notification finished.')
+    _notify(factory, next_number, is_start=True)
@@ -26,11 +26,47 @@ def _create_engine(context: click.Context, settings: DataBaseSettings) -> None:
 def create_all(engine: Engine) -> None:
     from quiz_bot.db.base import metadata
 
+    from quiz_bot.db import migrations
+
+    if migrations.has_tables(engine):
+        click.echo('Schema already exists, it will be upgraded instead')
+        _upgrade(engine)
+        metadata.create_all(engine)
+        return
+    _create_schema(engine)
+
+
+def _create_schema(engine: Engine) -> None:
+    from quiz_bot.db.base import metadata
+
+    from quiz_bot.db import migrations
+
     click.echo('Creating schema...')
     metadata.create_all(engine)
+    migrations.stamp(engine)
     click.echo('Schema successfully created')
 
 
+def _upgrade(engine: Engine) -> None:
+    from quiz_bot.db import migrations
+
+    if not migrations.has_tables(engine):
+        click.echo('Schema does not exist, it will be created instead')
+        _create_schema(engine)
+        return
+    click.echo(f'Upgrading schema from version {migrations.get_version(engine)}...')
+    applied = migrations.upgrade(engine)
+    for migration in applied:
+        click.echo(f'Applied migration #{migration.version}: {migration.description}')
+    click.echo(f'Schema is up to date with version {migrations.get_version(engine)}')
+
+
+@click.command()
+@click.pass_obj
+def upgrade(engine: Engine) -> None:
+    _upgrade(engine)
+
+
 @click.command()
 @click.pass_obj
 def drop_all(engine: Engine) -> None:
@@ -43,9 +79,22 @@ def drop_all(engine: Engine) -> None:
     click.echo('Schema successfully dropped!')
 
 
+@click.command()
+@click.pass_obj
+def rebuild_word_frequencies(engine: Engine) -> None:
+    from quiz_bot.entity import MessageCloudSettings
+    from quiz_bot.storage import MessageStorage
+
+    click.echo('Counting words of saved messages...')
+    words_amount = MessageStorage(MessageCloudSettings()).rebuild_word_frequencies()
+    click.echo(f'Word frequencies rebuilt, found {words_amount} distinct words')
+
+
 def db_commands(group: click.Group) -> click.Group:
     group.add_command(create_all)
     group.add_command(drop_all)
+    group.add_command(upgrade)
+    group.add_command(rebuild_word_frequencies)
     return group
 
 
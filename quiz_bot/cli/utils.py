@@ -1,4 +1,6 @@
 import io
+import signal
+from types import FrameType
 from typing import Optional, Type
 
 from pydantic import BaseSettings
@@ -8,3 +10,12 @@ def get_settings(file: Optional[io.StringIO], settings_type: Type[BaseSettings])
     if file is not None:
         return settings_type.parse_raw(file.read())
     return settings_type()
+
+
+def _exit_on_signal(signum: int, frame: Optional[FrameType]) -> None:
+    raise SystemExit(128 + signum)
+
+
+def handle_termination() -> None:
+    """ Stop by SIGTERM the same way as by SIGINT: with unwinding of stack, so that `finally` blocks are run. """
+    signal.signal(signal.SIGTERM, _exit_on_signal)
@@ -1,3 +1,6 @@
 # flake8: noqa
 from .shoutbox import ShoutboxClient, ShoutboxPrewrittenDetectedError, ShoutboxRequest, ShoutboxResponse
+from .broadcast import BroadcastProgress, BroadcastReport, Broadcaster, ProgressCallback
+from .scheduler import SchedulerMetrics, SendPriority
 from .telegram import BotResponse, RemoteBotClient, SendMessageError
+from .telegram_async import AsyncModeUnavailableError, AsyncRemoteBotClient, RemoteApiError
@@ -0,0 +1,145 @@
+import functools
+import http
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import telebot
+from quiz_bot.clients.scheduler import SendPriority
+from quiz_bot.clients.telegram import BotResponse, RemoteBotClient
+from quiz_bot.entity import BroadcastSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BroadcastProgress:
+    submitted: int
+    sent: int
+    failed: int
+    blocked: int
+    elapsed: float
+
+    @property
+    def completed(self) -> int:
+        return self.sent + self.failed + self.blocked
+
+
+@dataclass(frozen=True)
+class BroadcastReport:
+    sent: int
+    failed_chat_ids: Tuple[int, ...]
+    blocked_chat_ids: Tuple[int, ...]
+    elapsed: float
+
+
+ProgressCallback = Callable[[BroadcastProgress], None]
+
+
+def is_blocked_error(error: BaseException) -> bool:
+    return (
+        isinstance(error, telebot.apihelper.ApiTelegramException) and error.error_code == http.HTTPStatus.FORBIDDEN
+    )
+
+
+class _BroadcastState:
+    def __init__(self, max_pending: int) -> None:
+        self._condition = threading.Condition()
+        self._max_pending = max_pending
+        self._started_at = time.monotonic()
+        self.submitted = 0
+        self.sent = 0
+        self.failed_chat_ids: List[int] = []
+        self.blocked_chat_ids: List[int] = []
+
+    @property
+    def _pending(self) -> int:
+        return self.submitted - self.sent - len(self.failed_chat_ids) - len(self.blocked_chat_ids)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._pending >= self._max_pending:
+                self._condition.wait()
+            self.submitted += 1
+
+    def release(self, chat_id: int, future: 'Future[None]') -> None:
+        error = future.exception()
+        with self._condition:
+            if error is None:
+                self.sent += 1
+            elif is_blocked_error(error):
+                self.blocked_chat_ids.append(chat_id)
+            else:
+                logger.warning("Could not send broadcast message for chat ID %s: %s", chat_id, error)
+                self.failed_chat_ids.append(chat_id)
+            self._condition.notify_all()
+
+    def wait(self, timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout=timeout)
+
+    def get_progress(self) -> BroadcastProgress:
+        with self._condition:
+            return BroadcastProgress(
+                submitted=self.submitted,
+                sent=self.sent,
+                failed=len(self.failed_chat_ids),
+                blocked=len(self.blocked_chat_ids),
+                elapsed=self.elapsed,
+            )
+
+    def get_report(self) -> BroadcastReport:
+        with self._condition:
+            return BroadcastReport(
+                sent=self.sent,
+                failed_chat_ids=tuple(self.failed_chat_ids),
+                blocked_chat_ids=tuple(self.blocked_chat_ids),
+                elapsed=self.elapsed,
+            )
+
+
+class Broadcaster:
+    """ Sends responses to many chats in parallel through send scheduler with broadcast priority.
+    Optional pacing with jitter spreads the wave of users reactions over time. """
+
+    def __init__(self, client: RemoteBotClient, settings: BroadcastSettings) -> None:
+        self._client = client
+        self._settings = settings
+
+    def _get_interval(self) -> float:
+        if self._settings.rate_limit is None:
+            return 0.0
+        interval: float = 1 / self._settings.rate_limit
+        return interval * random.uniform(1 - self._settings.jitter, 1 + self._settings.jitter)
+
+    def broadcast(
+        self, responses: Iterable[BotResponse], progress_callback: Optional[ProgressCallback] = None
+    ) -> BroadcastReport:
+        state = _BroadcastState(max_pending=self._settings.max_pending)
+        next_at = reported_at = time.monotonic()
+        for response in responses:
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            state.acquire()
+            future = self._client.submit(response, priority=SendPriority.BROADCAST)
+            future.add_done_callback(functools.partial(state.release, response.user.remote_chat_id))
+            next_at = time.monotonic() + self._get_interval()
+            if progress_callback is not None and time.monotonic() - reported_at >= self._settings.progress_interval:
+                progress_callback(state.get_progress())
+                reported_at = time.monotonic()
+
+        while not state.wait(timeout=self._settings.progress_interval):
+            if progress_callback is not None:
+                progress_callback(state.get_progress())
+        if progress_callback is not None:
+            progress_callback(state.get_progress())
+        return state.get_report()
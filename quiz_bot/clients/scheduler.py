@@ -0,0 +1,248 @@
+import abc
+import collections
+import enum
+import heapq
+import http
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, cast
+
+import requests
+import telebot
+import tenacity
+from quiz_bot.entity import RemoteClientSettings
+from quiz_bot.utils import LRUCache, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+SendCall = Callable[[], None]
+
+_CHAT_BUCKETS_MAXSIZE = 10000
+_LATENCY_SMOOTHING = 0.1
+
+
+class SendPriority(enum.IntEnum):
+    INTERACTIVE = 0
+    BROADCAST = 1
+
+
+@dataclass(frozen=True)
+class SchedulerMetrics:
+    queue_depth: int
+    in_flight: int
+    sent: int
+    failed: int
+    throttled: int
+    average_latency: float
+    max_latency: float
+
+
+@dataclass
+class _SendJob:
+    chat_id: int
+    priority: SendPriority
+    calls: Sequence[SendCall]
+    future: 'Future[None]' = field(default_factory=Future)
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class BaseSendScheduler(abc.ABC):
+    """ Common policy of outgoing Bot API calls: sending rate is limited by global and per-chat token buckets,
+    after `429 Too Many Requests` sending to the chat is paused for `retry_after`, connection errors are retried
+    with backoff. Retried calls get buckets of `_get_buckets` as the first argument. """
+
+    def __init__(self, settings: RemoteClientSettings, rate_limit: float) -> None:
+        self._global_bucket = TokenBucket(rate=rate_limit)
+        self._chat_buckets: LRUCache[int, TokenBucket] = LRUCache(maxsize=_CHAT_BUCKETS_MAXSIZE)
+        self._chat_buckets_lock = threading.Lock()
+        self._chat_rate = settings.chat_send_rate_limit
+        self._chat_burst = settings.chat_send_burst
+        self._attempts = settings.send_attempts
+        self._backoff = tenacity.wait_exponential(multiplier=0.5, max=5)
+
+        self._metrics_lock = threading.Lock()
+        self._queue_depth = 0
+        self._in_flight = 0
+        self._sent = 0
+        self._failed = 0
+        self._throttled = 0
+        self._average_latency = 0.0
+        self._max_latency = 0.0
+
+    @abc.abstractmethod
+    def _get_retry_after(self, error: Optional[BaseException]) -> Optional[float]:
+        pass
+
+    @abc.abstractmethod
+    def _is_connection_error(self, error: BaseException) -> bool:
+        pass
+
+    @property
+    def metrics(self) -> SchedulerMetrics:
+        with self._metrics_lock:
+            return SchedulerMetrics(
+                queue_depth=self._queue_depth,
+                in_flight=self._in_flight,
+                sent=self._sent,
+                failed=self._failed,
+                throttled=self._throttled,
+                average_latency=self._average_latency,
+                max_latency=self._max_latency,
+            )
+
+    def _get_retry_options(self) -> Dict[str, Any]:
+        return dict(
+            reraise=True,
+            retry=tenacity.retry_if_exception(self._is_retryable),
+            stop=tenacity.stop_after_attempt(self._attempts),
+            wait=self._get_wait,
+            before_sleep=self._before_retry,
+        )
+
+    def _is_retryable(self, error: BaseException) -> bool:
+        return self._is_connection_error(error) or self._get_retry_after(error) is not None
+
+    @staticmethod
+    def _get_error(retry_state: tenacity.RetryCallState) -> Optional[BaseException]:
+        if retry_state.outcome is None:
+            return None
+        return cast(Optional[BaseException], retry_state.outcome.exception())
+
+    def _get_wait(self, retry_state: tenacity.RetryCallState) -> float:
+        if self._get_retry_after(self._get_error(retry_state)) is not None:
+            return 0
+        return float(self._backoff(retry_state))
+
+    def _before_retry(self, retry_state: tenacity.RetryCallState) -> None:
+        error = self._get_error(retry_state)
+        retry_after = self._get_retry_after(error)
+        if retry_after is not None:
+            with self._metrics_lock:
+                self._throttled += 1
+            self._get_throttled_bucket(retry_state).pause(retry_after)
+        logger.warning("Retry Bot API call after error (attempt #%s): %s", retry_state.attempt_number, error)
+
+    def _get_throttled_bucket(self, retry_state: tenacity.RetryCallState) -> TokenBucket:
+        """ Flood limit of one chat pauses only its bucket, limit of call without chat pauses all sending. """
+        buckets: Sequence[TokenBucket] = retry_state.args[0] if retry_state.args else ()
+        if len(buckets) > 1:
+            return buckets[0]
+        return self._global_bucket
+
+    def _get_buckets(self, chat_id: int) -> Tuple[TokenBucket, TokenBucket]:
+        """ Buckets to be reserved before every call, in order: bucket of the chat and global one. """
+        with self._chat_buckets_lock:
+            bucket = self._chat_buckets.get(chat_id)
+            if bucket is None:
+                bucket = TokenBucket(rate=self._chat_rate, capacity=self._chat_burst)
+                self._chat_buckets.set(chat_id, bucket)
+        return bucket, self._global_bucket
+
+    def _on_queued(self) -> None:
+        with self._metrics_lock:
+            self._queue_depth += 1
+
+    def _on_started(self) -> None:
+        with self._metrics_lock:
+            self._queue_depth -= 1
+            self._in_flight += 1
+
+    def _on_finished(self, created_at: float, failed: bool) -> None:
+        latency = time.monotonic() - created_at
+        with self._metrics_lock:
+            self._in_flight -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._sent += 1
+            self._average_latency += _LATENCY_SMOOTHING * (latency - self._average_latency)
+            self._max_latency = max(self._max_latency, latency)
+
+
+class SendScheduler(BaseSendScheduler):
+    """ Central queue of outgoing Bot API calls for threaded runtime: calls of every chat are made in order
+    by pool of sender threads, interactive replies are sent before broadcasts of the same process.
+
+    Queue is not shared between processes: bot process and CLI process with notifications have own schedulers,
+    so overall rate limit is split between them by `rate_limit`. """
+
+    def __init__(self, settings: RemoteClientSettings, rate_limit: float) -> None:
+        super().__init__(settings, rate_limit=rate_limit)
+        self._condition = threading.Condition()
+        self._queue: List[Tuple[SendPriority, int, _SendJob]] = []
+        self._chat_queues: Dict[int, Deque[_SendJob]] = {}
+        self._counter = itertools.count()
+
+        self._retrying = tenacity.Retrying(**self._get_retry_options())
+        for num in range(settings.send_workers):
+            threading.Thread(target=self._work, name=f'quiz-sender-{num}', daemon=True).start()
+
+    def _get_retry_after(self, error: Optional[BaseException]) -> Optional[float]:
+        if (
+            isinstance(error, telebot.apihelper.ApiTelegramException)
+            and error.error_code == http.HTTPStatus.TOO_MANY_REQUESTS
+        ):
+            retry_after = error.result_json.get('parameters', {}).get('retry_after')
+            if retry_after is not None:
+                return float(retry_after)
+        return None
+
+    def _is_connection_error(self, error: BaseException) -> bool:
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+    def submit(self, chat_id: int, calls: Sequence[SendCall], priority: SendPriority) -> 'Future[None]':
+        job = _SendJob(chat_id=chat_id, priority=priority, calls=calls)
+        self._on_queued()
+        with self._condition:
+            chat_queue = self._chat_queues.get(chat_id)
+            if chat_queue is None:
+                self._chat_queues[chat_id] = collections.deque()
+                self._push(job)
+            else:
+                chat_queue.append(job)
+        return job.future
+
+    def _push(self, job: _SendJob) -> None:
+        heapq.heappush(self._queue, (job.priority, next(self._counter), job))
+        self._condition.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                _, _, job = heapq.heappop(self._queue)
+            self._on_started()
+
+            error = self._execute(job)
+
+            self._on_finished(job.created_at, failed=error is not None)
+            with self._condition:
+                chat_queue = self._chat_queues[job.chat_id]
+                if chat_queue:
+                    self._push(chat_queue.popleft())
+                else:
+                    del self._chat_queues[job.chat_id]
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(None)
+
+    def _execute(self, job: _SendJob) -> Optional[Exception]:
+        buckets = self._get_buckets(job.chat_id)
+        try:
+            for call in job.calls:
+                self._retrying(self._call, buckets, call)
+        except Exception as e:
+            return e
+        return None
+
+    @staticmethod
+    def _call(buckets: Sequence[TokenBucket], call: SendCall) -> None:
+        for bucket in buckets:
+            time.sleep(bucket.reserve())
+        call()
@@ -1,12 +1,15 @@
 import collections
+import functools
 import logging
 import threading
-from typing import Any, DefaultDict, Dict, List, Optional
+from concurrent.futures import Future
+from dataclasses import InitVar, dataclass
+from typing import Any, DefaultDict, List, Optional, Sequence
 
 import requests
 import telebot
-import tenacity
-from pydantic import BaseModel, root_validator
+from quiz_bot.clients.scheduler import SchedulerMetrics, SendCall, SendPriority, SendScheduler
+from quiz_bot.clients.webhook import WebhookServer, set_webhook
 from quiz_bot.entity import ContextUser, PictureLocation, PictureModel, RemoteClientSettings
 
 logger = logging.getLogger(__name__)
@@ -20,24 +23,19 @@ class EmptyContentError(RuntimeError):
     pass
 
 
-class BotResponse(BaseModel):
+@dataclass(frozen=True)
+class BotResponse:
     user: ContextUser
-    user_message: Optional[str]
-    reply: Optional[str]
-    replies: List[str] = []
+    user_message: Optional[str] = None
+    reply: InitVar[Optional[str]] = None
+    replies: Sequence[str] = ()
     split: bool = False
-    markup: Optional[telebot.types.InlineKeyboardMarkup]
-    picture: Optional[PictureModel]
-
-    @root_validator
-    def make_replies(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        reply = values.get('reply')
-        if isinstance(reply, str):
-            values['replies'] = [reply]
-        replies = values.get('replies')
-        if not replies:
-            raise ValueError("No one reply has been specified!")
-        return values
+    markup: Optional[telebot.types.InlineKeyboardMarkup] = None
+    picture: Optional[PictureModel] = None
+
+    def __post_init__(self, reply: Optional[str]) -> None:
+        if reply is not None:
+            object.__setattr__(self, 'replies', (reply,))
 
     @property
     def has_picture_above(self) -> bool:
@@ -47,71 +45,86 @@ class BotResponse(BaseModel):
     def has_picture_below(self) -> bool:
         return self.picture is not None and self.picture.location is PictureLocation.BELOW
 
-    class Config:
-        arbitrary_types_allowed = True
+
+def get_grouped_replies(answers: Sequence[str], split_answers: bool) -> List[str]:
+    if split_answers:
+        return list(answers)
+    return [" ".join(answers)]
 
 
 class RemoteBotClient:
-    def __init__(self, settings: RemoteClientSettings) -> None:
+    def __init__(self, settings: RemoteClientSettings, rate_limit: float) -> None:
         self._settings = settings
+        telebot.apihelper.API_URL = settings.bot_api_url
         self._locks: DefaultDict[Any, threading.Lock] = collections.defaultdict(threading.Lock)
         self._telebot = telebot.TeleBot(token=settings.token, num_threads=settings.threads_num)
+        self._scheduler = SendScheduler(settings, rate_limit=rate_limit)
 
     @property
     def bot(self) -> telebot.TeleBot:
         return self._telebot
 
     def run_loop(self) -> None:
+        if self._settings.webhook_enabled:
+            set_webhook(self._settings)
+            WebhookServer(self._settings, callback=self._telebot.process_new_updates).serve_forever()
+            return
         self._telebot.polling(none_stop=True, timeout=self._settings.poll_timeout)
 
     @property
     def thread_lock(self) -> DefaultDict[Any, threading.Lock]:
         return self._locks
 
-    @staticmethod
-    def _get_grouped_replies(answers: List[str], split_answers: bool) -> List[str]:
-        if split_answers:
-            return answers
-        return [" ".join(answers)]
-
-    @tenacity.retry(
-        reraise=True,
-        retry=tenacity.retry_if_exception_type(SendMessageError),
-        stop=tenacity.stop_after_attempt(3),
-        before_sleep=tenacity.before_sleep_log(logger, logger.level),
-        after=tenacity.after_log(logger, logger.level),
-    )
-    def send(self, response: BotResponse) -> None:
+    @property
+    def send_metrics(self) -> SchedulerMetrics:
+        return self._scheduler.metrics
+
+    def submit(self, response: BotResponse, priority: SendPriority) -> 'Future[None]':
+        """ Put response into sending queue without waiting, future holds original Bot API error. """
+        return self._scheduler.submit(
+            chat_id=response.user.remote_chat_id, calls=self._get_calls(response), priority=priority
+        )
+
+    def send(self, response: BotResponse, priority: SendPriority = SendPriority.INTERACTIVE) -> None:
         try:
-            if response.has_picture_above:
-                self._send_picture(response)
-            self._send_message(response)
-            if response.has_picture_below:
-                self._send_picture(response)
-        except (requests.ConnectionError, telebot.apihelper.ApiException) as e:
+            self.submit(response, priority).result()
+        except (requests.RequestException, telebot.apihelper.ApiException) as e:
             logger.error("Catched error while trying to send message for chat ID %s!", response.user.remote_chat_id)
             raise SendMessageError from e
 
-    def _send_message(self, response: BotResponse) -> None:
-        messages = self._get_grouped_replies(answers=response.replies, split_answers=response.split)
+    def _get_calls(self, response: BotResponse) -> List[SendCall]:
+        if not response.replies:
+            raise EmptyContentError("No one reply has been specified!")
+        calls: List[SendCall] = []
+        if response.has_picture_above:
+            calls.append(functools.partial(self._send_picture, response))
+        messages = get_grouped_replies(answers=response.replies, split_answers=response.split)
         for num, message in enumerate(messages, start=1):
             markup = None
             if num == len(messages):
                 markup = response.markup
-            logger.info(
-                'Chat ID %s with %s: [user] %s -> [bot] %s',
-                response.user.remote_chat_id,
-                response.user.full_name,
-                response.user_message,
-                message,
-            )
-            self._telebot.send_message(
-                chat_id=response.user.remote_chat_id,
-                text=message,
-                parse_mode='html',
-                reply_markup=markup,
-                timeout=self._settings.read_timeout,
-            )
+            calls.append(functools.partial(self._send_message, response, message, markup))
+        if response.has_picture_below:
+            calls.append(functools.partial(self._send_picture, response))
+        return calls
+
+    def _send_message(
+        self, response: BotResponse, message: str, markup: Optional[telebot.types.InlineKeyboardMarkup]
+    ) -> None:
+        logger.info(
+            'Chat ID %s with %s: [user] %s -> [bot] %s',
+            response.user.remote_chat_id,
+            response.user.full_name,
+            response.user_message,
+            message,
+        )
+        self._telebot.send_message(
+            chat_id=response.user.remote_chat_id,
+            text=message,
+            parse_mode='html',
+            reply_markup=markup,
+            timeout=self._settings.read_timeout,
+        )
 
     def _send_picture(self, response: BotResponse) -> None:
         if response.picture is None:
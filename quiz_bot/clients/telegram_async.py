@@ -0,0 +1,240 @@
+import asyncio
+import functools
+import http
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import telebot
+import tenacity
+from quiz_bot.clients.scheduler import BaseSendScheduler, SchedulerMetrics
+from quiz_bot.clients.telegram import BotResponse, EmptyContentError, SendMessageError, get_grouped_replies
+from quiz_bot.clients.webhook import WebhookRequestError, get_webhook_params, parse_webhook_request
+from quiz_bot.entity import RemoteClientSettings
+from quiz_bot.utils import TokenBucket
+
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:  # pragma: no cover
+    aiohttp = web = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_POLL_RETRY_DELAY = 1
+
+UpdateCallback = Callable[[telebot.types.Update], None]
+AsyncSendCall = Callable[[], Awaitable[None]]
+
+
+class AsyncModeUnavailableError(RuntimeError):
+    pass
+
+
+class RemoteApiError(RuntimeError):
+    def __init__(self, method: str, result: Dict[str, Any]) -> None:
+        super().__init__(f"Bot API method '{method}' failed: {result.get('description')}")
+        self.error_code: Optional[int] = result.get('error_code')
+        self.retry_after: Optional[int] = result.get('parameters', {}).get('retry_after')
+
+
+class AsyncSendScheduler(BaseSendScheduler):
+    """ Outgoing Bot API calls of asyncio runtime with the same rate limits and retries as in threaded one:
+    responses of every chat are sent in order of submission. """
+
+    def __init__(self, settings: RemoteClientSettings) -> None:
+        super().__init__(settings, rate_limit=settings.interactive_rate_limit)
+        self._retrying = tenacity.AsyncRetrying(sleep=asyncio.sleep, **self._get_retry_options())
+        self._chat_tails: Dict[int, 'asyncio.Future[None]'] = {}
+
+    def _get_retry_after(self, error: Optional[BaseException]) -> Optional[float]:
+        if (
+            isinstance(error, RemoteApiError)
+            and error.error_code == http.HTTPStatus.TOO_MANY_REQUESTS
+            and error.retry_after is not None
+        ):
+            return float(error.retry_after)
+        return None
+
+    def _is_connection_error(self, error: BaseException) -> bool:
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    async def send(self, chat_id: int, calls: Sequence[AsyncSendCall]) -> None:
+        created_at = time.monotonic()
+        previous = self._chat_tails.get(chat_id)
+        tail: 'asyncio.Future[None]' = asyncio.get_running_loop().create_future()
+        self._chat_tails[chat_id] = tail
+        self._on_queued()
+        failed = True
+        try:
+            if previous is not None:
+                await asyncio.shield(previous)
+            self._on_started()
+            buckets = self._get_buckets(chat_id)
+            for call in calls:
+                await self._retrying(self._call, buckets, call)
+            failed = False
+        finally:
+            self._on_finished(created_at, failed=failed)
+            tail.set_result(None)
+            if self._chat_tails.get(chat_id) is tail:
+                del self._chat_tails[chat_id]
+
+    @staticmethod
+    async def _call(buckets: Sequence[TokenBucket], call: AsyncSendCall) -> None:
+        for bucket in buckets:
+            await asyncio.sleep(bucket.reserve())
+        await call()
+
+
+class AsyncRemoteBotClient:
+    """ Bot API client for asyncio runtime, should be used as async context manager. """
+
+    def __init__(self, settings: RemoteClientSettings) -> None:
+        if aiohttp is None:
+            raise AsyncModeUnavailableError("Async mode requires 'aiohttp', install Quiz-bot with 'async' extra!")
+        self._settings = settings
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._scheduler = AsyncSendScheduler(settings)
+
+    async def __aenter__(self) -> 'AsyncRemoteBotClient':
+        self._session = aiohttp.ClientSession()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _call(self, method: str, timeout: float, **kwargs: Any) -> Any:
+        if self._session is None:
+            raise RuntimeError("AsyncRemoteBotClient is used outside of its context!")
+        async with self._session.post(
+            self._settings.bot_api_url.format(self._settings.token, method),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            **kwargs,
+        ) as response:
+            result = await response.json(content_type=None)
+        if not result.get('ok'):
+            raise RemoteApiError(method, result)
+        return result['result']
+
+    async def get_updates(self, offset: Optional[int]) -> List[telebot.types.Update]:
+        payload: Dict[str, Any] = {'timeout': self._settings.poll_timeout}
+        if offset is not None:
+            payload['offset'] = offset
+        updates = await self._call(
+            'getUpdates', timeout=self._settings.poll_timeout + self._settings.read_timeout, json=payload
+        )
+        return [telebot.types.Update.de_json(x) for x in updates]
+
+    async def set_webhook(self) -> None:
+        await self._call('setWebhook', timeout=self._settings.read_timeout, json=get_webhook_params(self._settings))
+        logger.info("Webhook is set to %s", self._settings.webhook_url)
+
+    async def run_loop(self, callback: UpdateCallback) -> None:
+        if self._settings.webhook_enabled:
+            await self._listen(callback)
+            return
+        await self._poll(callback)
+
+    async def _poll(self, callback: UpdateCallback) -> None:
+        offset: Optional[int] = None
+        while True:
+            try:
+                updates = await self.get_updates(offset)
+            except (aiohttp.ClientError, asyncio.TimeoutError, RemoteApiError):
+                logger.exception("Could not get updates from Bot API!")
+                await asyncio.sleep(_POLL_RETRY_DELAY)
+                continue
+            for update in updates:
+                offset = update.update_id + 1
+                callback(update)
+
+    async def _listen(self, callback: UpdateCallback) -> None:
+        async def handle(request: web.Request) -> web.Response:
+            try:
+                update = parse_webhook_request(
+                    self._settings, path=request.path, headers=request.headers, body=await request.read()
+                )
+            except WebhookRequestError as e:
+                logger.warning("Rejected webhook request: %s", e)
+                return web.Response(status=e.status)
+            callback(update)
+            return web.Response()
+
+        app = web.Application()
+        app.router.add_post(self._settings.webhook_path, handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self._settings.webhook_host, self._settings.webhook_port).start()
+            logger.info(
+                "Webhook server is listening on %s:%s", self._settings.webhook_host, self._settings.webhook_port
+            )
+            await self.set_webhook()
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+
+    async def answer_callback_query(self, query_id: str) -> None:
+        await self._call(
+            'answerCallbackQuery', timeout=self._settings.read_timeout, json={'callback_query_id': query_id}
+        )
+
+    @property
+    def send_metrics(self) -> SchedulerMetrics:
+        return self._scheduler.metrics
+
+    async def send(self, response: BotResponse) -> None:
+        try:
+            await self._scheduler.send(chat_id=response.user.remote_chat_id, calls=self._get_calls(response))
+        except (aiohttp.ClientError, asyncio.TimeoutError, RemoteApiError) as e:
+            logger.error("Catched error while trying to send message for chat ID %s!", response.user.remote_chat_id)
+            raise SendMessageError from e
+
+    def _get_calls(self, response: BotResponse) -> List[AsyncSendCall]:
+        if not response.replies:
+            raise EmptyContentError("No one reply has been specified!")
+        calls: List[AsyncSendCall] = []
+        if response.has_picture_above:
+            calls.append(functools.partial(self._send_picture, response))
+        messages = get_grouped_replies(answers=response.replies, split_answers=response.split)
+        for num, message in enumerate(messages, start=1):
+            markup = None
+            if num == len(messages):
+                markup = response.markup
+            calls.append(functools.partial(self._send_message, response, message, markup))
+        if response.has_picture_below:
+            calls.append(functools.partial(self._send_picture, response))
+        return calls
+
+    async def _send_message(
+        self, response: BotResponse, message: str, markup: Optional[telebot.types.InlineKeyboardMarkup]
+    ) -> None:
+        payload: Dict[str, Any] = {'chat_id': response.user.remote_chat_id, 'text': message, 'parse_mode': 'html'}
+        if markup is not None:
+            payload['reply_markup'] = json.loads(markup.to_json())
+        logger.info(
+            'Chat ID %s with %s: [user] %s -> [bot] %s',
+            response.user.remote_chat_id,
+            response.user.full_name,
+            response.user_message,
+            message,
+        )
+        await self._call('sendMessage', timeout=self._settings.read_timeout, json=payload)
+
+    async def _send_picture(self, response: BotResponse) -> None:
+        if response.picture is None:
+            raise EmptyContentError("Has not got picture for sending!")
+        logger.info(
+            'Chat ID %s with %s: send picture %s',
+            response.user.remote_chat_id,
+            response.user.full_name,
+            response.picture.file.name,
+        )
+        data = aiohttp.FormData()
+        data.add_field('chat_id', str(response.user.remote_chat_id))
+        data.add_field('photo', response.picture.file.read_bytes(), filename=response.picture.file.name)
+        await self._call('sendPhoto', timeout=self._settings.read_timeout, data=data)
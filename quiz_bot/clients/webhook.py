@@ -0,0 +1,99 @@
+import hmac
+import http
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Mapping, Optional
+
+import requests
+import telebot
+from quiz_bot.entity import RemoteClientSettings
+
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = 'X-Telegram-Bot-Api-Secret-Token'
+
+UpdatesCallback = Callable[[List[telebot.types.Update]], None]
+
+
+class WebhookRequestError(RuntimeError):
+    def __init__(self, status: http.HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> str:
+    """ Header names are case-insensitive, proxies could send them in lower case. """
+    return next((value for key, value in headers.items() if key.lower() == name.lower()), '')
+
+
+def parse_webhook_request(
+    settings: RemoteClientSettings, path: str, headers: Mapping[str, str], body: bytes
+) -> telebot.types.Update:
+    """ Validate request from Bot API webhook and build update from it. """
+    if path != settings.webhook_path:
+        raise WebhookRequestError(http.HTTPStatus.NOT_FOUND, f"Unknown webhook path '{path}'!")
+    if settings.webhook_secret is not None and not hmac.compare_digest(
+        _get_header(headers, SECRET_TOKEN_HEADER), settings.webhook_secret
+    ):
+        raise WebhookRequestError(http.HTTPStatus.FORBIDDEN, "Invalid webhook secret token!")
+    try:
+        return telebot.types.Update.de_json(json.loads(body))
+    except (ValueError, KeyError, TypeError) as e:
+        raise WebhookRequestError(http.HTTPStatus.BAD_REQUEST, f"Malformed update: {e}") from e
+
+
+def get_webhook_params(settings: RemoteClientSettings) -> Mapping[str, Optional[str]]:
+    params = {'url': settings.webhook_url}
+    if settings.webhook_secret is not None:
+        params['secret_token'] = settings.webhook_secret
+    return params
+
+
+def set_webhook(settings: RemoteClientSettings) -> None:
+    response = requests.post(
+        settings.bot_api_url.format(settings.token, 'setWebhook'),
+        json=get_webhook_params(settings),
+        timeout=settings.read_timeout,
+    )
+    response.raise_for_status()
+    logger.info("Webhook is set to %s", settings.webhook_url)
+
+
+class WebhookServer:
+    """ Embedded HTTP endpoint for Bot API webhook: every valid update is passed to callback right away. """
+
+    def __init__(self, settings: RemoteClientSettings, callback: UpdatesCallback) -> None:
+        self._settings = settings
+        self._callback = callback
+
+    def _make_handler(self) -> type:
+        settings = self._settings
+        callback = self._callback
+
+        class WebhookHandler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                try:
+                    update = parse_webhook_request(settings, path=self.path, headers=dict(self.headers), body=body)
+                except WebhookRequestError as e:
+                    logger.warning("Rejected webhook request: %s", e)
+                    self.send_response(e.status)
+                    self.end_headers()
+                    return
+                callback([update])
+                self.send_response(http.HTTPStatus.OK)
+                self.end_headers()
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(format, *args)
+
+        return WebhookHandler
+
+    def serve_forever(self) -> None:
+        server = ThreadingHTTPServer((self._settings.webhook_host, self._settings.webhook_port), self._make_handler())
+        logger.info("Webhook server is listening on %s:%s", self._settings.webhook_host, self._settings.webhook_port)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
@@ -1,8 +1,10 @@
 # flake8: noqa
+from . import migrations
 from .base import current_session
 from .challenge import Challenge
 from .message import Message
 from .participant import Participant
 from .result import Result
 from .user import User
-from .utils import create_session
+from .word import WordFrequency
+from .utils import add_rollback_listener, create_session, unit_of_work
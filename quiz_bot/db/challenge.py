@@ -37,3 +37,6 @@ class Challenge(PrimaryKeyMixin, Base):
         self.phase_amount = phase_amount
         self.winner_amount = winner_amount
         self.duration = duration
+
+
+sa.Index('ix_challenges_actual', Challenge.id, postgresql_where=Challenge.finished_at.is_(None))
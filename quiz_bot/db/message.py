@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Sequence, cast
+import datetime
+from typing import Optional
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -9,8 +10,15 @@ from quiz_bot.db.base import Base, PrimaryKeyMixin
 
 
 class MessageQuery(so.Query):
-    def get_message_ids(self, limit: int) -> Sequence[int]:
-        return cast(Sequence[int], self.session.query(Message).with_entities(Message.id).limit(limit).all())
+    def get_recent(self, limit: Optional[int], since: Optional[datetime.datetime]) -> so.Query:
+        """ Rows of newest messages, at most `limit` of them and not older than `since`. """
+        query = self.session.query(*Message.__table__.columns).filter(Message.created_at.isnot(None))
+        if since is not None:
+            query = query.filter(Message.created_at >= since)
+        query = query.order_by(Message.created_at.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query
 
 
 @su.generic_repr('user_id', 'text')
@@ -22,3 +30,6 @@ class Message(PrimaryKeyMixin, Base):
 
     def __init__(self, text: str,) -> None:
         self.text = text
+
+
+sa.Index('ix_messages_created_at', Message.created_at)
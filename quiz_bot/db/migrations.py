@@ -0,0 +1,125 @@
+import logging
+from typing import List, Sequence
+
+import sqlalchemy as sa
+from pydantic import BaseModel
+from quiz_bot.db.base import metadata
+from sqlalchemy.engine import Connectable, Engine
+
+logger = logging.getLogger(__name__)
+
+schema_versions = sa.Table(
+    'schema_versions',
+    metadata,
+    sa.Column('version', sa.Integer, primary_key=True),
+    sa.Column('description', sa.String, nullable=False),
+    sa.Column('applied_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+)
+
+
+class Migration(BaseModel):
+    version: int
+    description: str
+    statements: List[str]
+
+
+MIGRATIONS: Sequence[Migration] = (
+    Migration(
+        version=1,
+        description="Indexes and unique constraints for quiz queries",
+        statements=[
+            # Duplicates made by concurrent registration: participants are moved to the first user with the same
+            # external ID, the most advanced participant and the first result of every phase are kept
+            "UPDATE participants SET user_id = kept.id "
+            "FROM users AS duplicate, (SELECT external_id, min(id) AS id FROM users GROUP BY external_id) AS kept "
+            "WHERE participants.user_id = duplicate.id AND duplicate.external_id = kept.external_id "
+            "AND duplicate.id <> kept.id",
+            "DELETE FROM users USING users AS kept WHERE users.external_id = kept.external_id AND users.id > kept.id",
+            "CREATE TEMPORARY TABLE duplicate_participants ON COMMIT DROP AS "
+            "SELECT id FROM (SELECT id, row_number() OVER (PARTITION BY user_id, challenge_id "
+            "ORDER BY scores DESC, finished_at NULLS LAST, id) AS position FROM participants) AS ranked "
+            "WHERE position > 1",
+            "DELETE FROM results WHERE participant_id IN (SELECT id FROM duplicate_participants)",
+            "DELETE FROM participants WHERE id IN (SELECT id FROM duplicate_participants)",
+            "DELETE FROM results USING results AS kept "
+            "WHERE results.participant_id = kept.participant_id AND results.phase = kept.phase "
+            "AND results.id > kept.id",
+            "ALTER TABLE users ADD CONSTRAINT uq_users_external_id UNIQUE (external_id)",
+            "ALTER TABLE participants "
+            "ADD CONSTRAINT uq_participants_user_id_challenge_id UNIQUE (user_id, challenge_id)",
+            "CREATE INDEX ix_participants_challenge_id_scores ON participants (challenge_id, scores)",
+            "CREATE INDEX ix_participants_pretenders ON participants (challenge_id, scores DESC, finished_at) "
+            "WHERE finished_at IS NOT NULL",
+            "ALTER TABLE results ADD CONSTRAINT uq_results_participant_id_phase UNIQUE (participant_id, phase)",
+            "CREATE INDEX ix_challenges_actual ON challenges (id) WHERE finished_at IS NULL",
+        ],
+    ),
+    Migration(
+        version=2,
+        description="Current phase and result of participants",
+        statements=[
+            "ALTER TABLE participants ADD COLUMN current_phase INTEGER",
+            "ALTER TABLE participants ADD COLUMN current_result_id INTEGER",
+            "ALTER TABLE participants ADD CONSTRAINT participants_current_result_id_fkey "
+            "FOREIGN KEY (current_result_id) REFERENCES results (id)",
+            "UPDATE participants SET current_phase = last.phase, current_result_id = last.id "
+            "FROM (SELECT DISTINCT ON (participant_id) participant_id, id, phase FROM results "
+            "ORDER BY participant_id, phase DESC) AS last "
+            "WHERE last.participant_id = participants.id",
+        ],
+    ),
+    Migration(
+        version=3,
+        description="Index for selection of recent messages",
+        statements=["CREATE INDEX ix_messages_created_at ON messages (created_at)"],
+    ),
+    Migration(
+        version=4,
+        description="Word frequencies of messages",
+        statements=[
+            "CREATE TABLE word_frequencies (word VARCHAR NOT NULL PRIMARY KEY, frequency INTEGER NOT NULL)",
+            "CREATE INDEX ix_word_frequencies_frequency ON word_frequencies (frequency)",
+        ],
+    ),
+)
+
+
+def has_tables(bind: Connectable) -> bool:
+    """ Check whether any table of the models already exists. """
+    existing_tables = set(sa.inspect(bind).get_table_names())
+    return any(table in existing_tables for table in metadata.tables if table != schema_versions.name)
+
+
+def get_version(bind: Connectable) -> int:
+    schema_versions.create(bind, checkfirst=True)
+    version = bind.execute(sa.select([sa.func.max(schema_versions.c.version)])).scalar()
+    return int(version or 0)
+
+
+def _mark_applied(bind: Connectable, migration: Migration) -> None:
+    bind.execute(schema_versions.insert().values(version=migration.version, description=migration.description))
+
+
+def upgrade(bind: Engine) -> List[Migration]:
+    """ Apply not yet applied migrations, each one in its own transaction. """
+    current_version = get_version(bind)
+    applied: List[Migration] = []
+    for migration in MIGRATIONS:
+        if migration.version <= current_version:
+            continue
+        logger.info("Applying migration #%s: %s", migration.version, migration.description)
+        with bind.begin() as connection:
+            for statement in migration.statements:
+                connection.execute(sa.text(statement))
+            _mark_applied(connection, migration)
+        applied.append(migration)
+    return applied
+
+
+def stamp(bind: Engine) -> None:
+    """ Mark all migrations as applied, e.g. for schema created from the models. """
+    current_version = get_version(bind)
+    with bind.begin() as connection:
+        for migration in MIGRATIONS:
+            if migration.version > current_version:
+                _mark_applied(connection, migration)
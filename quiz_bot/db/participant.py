@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, cast
+from typing import Any, Optional, Sequence, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -9,12 +9,24 @@ from quiz_bot.db.base import Base, PrimaryKeyMixin
 from quiz_bot.db.challenge import Challenge
 from quiz_bot.db.user import User
 
+_WITH_RELATIONS = (so.joinedload('user'), so.joinedload('challenge'))
+
 
 class ParticipantQuery(so.Query):
     def get_by_challenge(self, user_id: int, challenge_id: int) -> Optional[Participant]:
         return cast(
             Optional[Participant],
             self.session.query(Participant)
+            .options(*_WITH_RELATIONS)
+            .filter(Participant.user_id == user_id, Participant.challenge_id == challenge_id)
+            .one_or_none(),
+        )
+
+    def get_snapshot(self, user_id: int, challenge_id: int) -> Optional[Participant]:
+        return cast(
+            Optional[Participant],
+            self.session.query(Participant)
+            .options(*_WITH_RELATIONS, so.joinedload('current_result'))
             .filter(Participant.user_id == user_id, Participant.challenge_id == challenge_id)
             .one_or_none(),
         )
@@ -22,6 +34,7 @@ class ParticipantQuery(so.Query):
     def get_sorted_pretenders(self, challenge_id: int, limit: Optional[int] = None) -> Sequence[Participant]:
         query = (
             self.session.query(Participant)
+            .options(*_WITH_RELATIONS)
             .filter(Participant.challenge_id == challenge_id, Participant.finished_at.isnot(None))
             .order_by(Participant.scores.desc(), Participant.finished_at.asc())
         )
@@ -29,31 +42,21 @@ class ParticipantQuery(so.Query):
             query = query.limit(limit)
         return cast(Sequence[Participant], query.all())
 
-    def get_participant_amount(self, challenge_id: int) -> int:
-        return cast(
-            int,
-            self.session.query(Participant)
-            .with_entities(Participant.id)
-            .filter(Participant.challenge_id == challenge_id)
-            .count(),
-        )
-
-    def get_pretenders_amount(self, challenge_id: int) -> int:
-        return cast(
-            int,
-            self.session.query(Participant)
-            .with_entities(Participant.id)
-            .filter(Participant.challenge_id == challenge_id, Participant.finished_at.isnot(None))
-            .count(),
-        )
-
-    def get_max_scores(self, challenge_id: int) -> Optional[int]:
+    def get_challenge_summaries(self) -> Sequence[Any]:
+        """ Rows of all challenges with amounts of their participants and pretenders and max scores. """
         return cast(
-            Optional[int],
-            self.session.query(Participant)
-            .filter(Participant.challenge_id == challenge_id)
-            .order_by(Participant.scores.desc())
-            .first(),
+            Sequence[Any],
+            self.session.query(
+                *Challenge.__table__.columns,
+                sa.func.count(Participant.id).label('participants'),
+                sa.func.count(Participant.id).filter(Participant.finished_at.isnot(None)).label('pretenders'),
+                sa.func.max(Participant.scores).label('max_scores'),
+            )
+            .select_from(Challenge)
+            .outerjoin(Participant, Participant.challenge_id == Challenge.id)
+            .group_by(Challenge.id)
+            .order_by(Challenge.id.asc())
+            .all(),
         )
 
 
@@ -61,16 +64,34 @@ class ParticipantQuery(so.Query):
 class Participant(PrimaryKeyMixin, Base):
     __tablename__ = 'participants'  # type: ignore
     __query_cls__ = ParticipantQuery
+    __table_args__ = (
+        sa.UniqueConstraint('user_id', 'challenge_id', name='uq_participants_user_id_challenge_id'),
+        sa.Index('ix_participants_challenge_id_scores', 'challenge_id', 'scores'),
+    )
 
     user_id = sa.Column(sa.Integer, sa.ForeignKey(User.id), nullable=False)
     challenge_id = sa.Column(sa.Integer, sa.ForeignKey(Challenge.id), nullable=False)
     finished_at = sa.Column(sa.DateTime(timezone=True))
     scores = sa.Column(sa.Integer, nullable=False)
+    current_phase = sa.Column(sa.Integer)
+    current_result_id = sa.Column(
+        sa.Integer, sa.ForeignKey('results.id', use_alter=True, name='participants_current_result_id_fkey')
+    )
 
     user = so.relationship(User, backref=so.backref("user", cascade="all, delete-orphan"))
     challenge = so.relationship(Challenge, backref=so.backref("challenge", cascade="all, delete-orphan"))
+    current_result = so.relationship('Result', foreign_keys=[current_result_id])
 
     def __init__(self, user_id: int, challenge_id: int,) -> None:
         self.user_id = user_id
         self.challenge_id = challenge_id
         self.scores = 0
+
+
+sa.Index(
+    'ix_participants_pretenders',
+    Participant.challenge_id,
+    Participant.scores.desc(),
+    Participant.finished_at,
+    postgresql_where=Participant.finished_at.isnot(None),
+)
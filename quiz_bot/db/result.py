@@ -9,25 +9,28 @@ from quiz_bot.db.base import Base, PrimaryKeyMixin
 
 
 class ResultQuery(so.Query):
-    def last_for_participant(self, participant_id: int) -> Optional[Result]:
+    def get_current(self, participant_id: int) -> Optional[Result]:
         return cast(
             Optional[Result],
             self.session.query(Result)
-            .filter(Result.participant_id == participant_id)
-            .order_by(Result.phase.desc())
-            .first(),
+            .join(Participant, Participant.current_result_id == Result.id)
+            .filter(Participant.id == participant_id)
+            .one_or_none(),
         )
 
 
 class Result(PrimaryKeyMixin, Base):
     __tablename__ = 'results'  # type: ignore
     __query_cls__ = ResultQuery
+    __table_args__ = (sa.UniqueConstraint('participant_id', 'phase', name='uq_results_participant_id_phase'),)
 
     participant_id = sa.Column(sa.Integer, sa.ForeignKey(Participant.id), nullable=False)
     phase = sa.Column(sa.Integer, nullable=False)
     finished_at = sa.Column(sa.DateTime(timezone=True))
 
-    participant = so.relationship(Participant, backref=so.backref("participant", cascade="all, delete-orphan"))
+    participant = so.relationship(
+        Participant, foreign_keys=[participant_id], backref=so.backref("participant", cascade="all, delete-orphan")
+    )
 
     def __init__(self, participant_id: int, phase: int) -> None:
         self.participant_id = participant_id
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, cast
+from typing import Any, Optional, Sequence, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -12,8 +12,16 @@ class UserQuery(so.Query):
     def get_by_external_id(self, value: int) -> Optional[User]:
         return cast(Optional[User], self.session.query(User).filter(User.external_id == value).one_or_none())
 
-    def get_all_user_ids(self) -> Sequence[int]:
-        return cast(Sequence[int], self.session.query(User).with_entities(User.id).all())
+    def get_batch_after(self, user_id: int, limit: int) -> Sequence[Any]:
+        """ Keyset page of users rows with ID greater than given one. """
+        return cast(
+            Sequence[Any],
+            self.session.query(*User.__table__.columns)
+            .filter(User.id > user_id)
+            .order_by(User.id.asc())
+            .limit(limit)
+            .all(),
+        )
 
     def get_by_nick_name(self, value: str) -> Optional[User]:
         return cast(
@@ -25,6 +33,7 @@ class UserQuery(so.Query):
 class User(PrimaryKeyMixin, Base):
     __tablename__ = 'users'  # type: ignore
     __query_cls__ = UserQuery
+    __table_args__ = (sa.UniqueConstraint('external_id', name='uq_users_external_id'),)
 
     external_id = sa.Column(sa.Integer, nullable=False)
     remote_chat_id = sa.Column(sa.Integer, nullable=False)
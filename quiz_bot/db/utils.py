@@ -1,13 +1,20 @@
+import threading
 from contextlib import contextmanager
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator, Optional
 
+import sqlalchemy as sa
 import sqlalchemy.orm as so
 from quiz_bot.db.base import Session
 
+_local = threading.local()
+
+
+def _get_unit_session() -> Optional[so.Session]:
+    return getattr(_local, 'session', None)
+
 
 @contextmanager
-def create_session(**kwargs: Any) -> Iterator[so.Session]:
-    """Provide a transactional scope around a series of operations."""
+def _transactional_session(**kwargs: Any) -> Iterator[so.Session]:
     new_session = Session(**kwargs)
     try:
         yield new_session
@@ -17,3 +24,35 @@ def create_session(**kwargs: Any) -> Iterator[so.Session]:
         raise
     finally:
         new_session.close()
+
+
+@contextmanager
+def create_session(**kwargs: Any) -> Iterator[so.Session]:
+    """Provide a transactional scope around a series of operations.
+    Inside of `unit_of_work` the shared session is provided and committed by the unit itself."""
+    unit_session = _get_unit_session()
+    if unit_session is not None:
+        yield unit_session
+        return
+    with _transactional_session(**kwargs) as session:
+        yield session
+
+
+@contextmanager
+def unit_of_work(**kwargs: Any) -> Iterator[so.Session]:
+    """Provide one session and one transaction for all `create_session` calls made in current thread."""
+    unit_session = _get_unit_session()
+    if unit_session is not None:
+        yield unit_session
+        return
+    with _transactional_session(**kwargs) as session:
+        _local.session = session
+        try:
+            yield session
+        finally:
+            _local.session = None
+
+
+def add_rollback_listener(callback: Callable[[], None]) -> None:
+    """Call `callback` after any rolled back transaction, so in-memory state written through it could be dropped."""
+    sa.event.listen(Session, 'after_rollback', lambda _: callback())
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Dict, cast
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+import sqlalchemy_utils as su
+from quiz_bot.db.base import Base
+
+
+class WordFrequencyQuery(so.Query):
+    def get_top(self, limit: int) -> Dict[str, int]:
+        rows = (
+            self.session.query(WordFrequency.word, WordFrequency.frequency)
+            .order_by(WordFrequency.frequency.desc())
+            .limit(limit)
+            .all()
+        )
+        return cast(Dict[str, int], dict(rows))
+
+
+@su.generic_repr('word', 'frequency')
+class WordFrequency(Base):
+    __tablename__ = 'word_frequencies'  # type: ignore
+    __query_cls__ = WordFrequencyQuery
+
+    word = sa.Column(sa.String, primary_key=True)
+    frequency = sa.Column(sa.Integer, nullable=False)
+
+
+sa.Index('ix_word_frequencies_frequency', WordFrequency.frequency)
@@ -4,11 +4,15 @@ from .errors import UnexpectedChallengeAmountError
 from .objects import (
     AnswerEvaluation,
     BaseChallengeInfo,
+    BufferOverflowPolicy,
+    ChallengeSummary,
     ChallengeType,
     CheckedResult,
+    CloudSource,
     EvaluationStatus,
     PictureLocation,
     PictureModel,
+    PlayerSnapshot,
     QuizState,
     RegularChallengeInfo,
     StoryChallengeInfo,
@@ -17,13 +21,17 @@ from .objects import (
     WinnerResult,
 )
 from .settings import (
+    BroadcastSettings,
     ChallengeSettings,
     DataBaseSettings,
     InfoSettings,
     LoggingSettings,
+    MessageBufferSettings,
     MessageCloudSettings,
     RemoteClientSettings,
     ShoutboxSettings,
+    StatisticsSettings,
     SymbolReplacementSettings,
+    UserStorageSettings,
 )
 from .types import AnyChallengeInfo, TChallengeInfo
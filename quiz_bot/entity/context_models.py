@@ -1,12 +1,52 @@
 import datetime
-from typing import cast
+from typing import Any, Optional, Tuple, Type, TypeVar, cast
 
-from pydantic_sqlalchemy import sqlalchemy_to_pydantic
+import sqlalchemy as sa
 from quiz_bot import db
 from quiz_bot.utils import get_now
 
+TContextModel = TypeVar('TContextModel', bound='ContextModel')
+
+
+def _get_fields(model: Type[Any]) -> Tuple[str, ...]:
+    return tuple(x.key for x in sa.inspect(model).column_attrs)
+
+
+class ContextModel:
+    """ Slotted container for trusted database data: values are taken as is, without validation. """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __init__(self, **values: Any) -> None:
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_orm(cls: Type[TContextModel], obj: Any) -> TContextModel:
+        return cls(**{name: getattr(obj, name) for name in cls.__slots__})
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class ContextUser(ContextModel):
+    __slots__ = _get_fields(db.User)
+
+    id: int
+    created_at: Optional[datetime.datetime]
+    external_id: int
+    remote_chat_id: int
+    chitchat_id: str
+    first_name: Optional[str]
+    last_name: Optional[str]
+    nick_name: Optional[str]
 
-class ContextUser(sqlalchemy_to_pydantic(db.User)):  # type: ignore
     @property
     def full_name(self) -> str:
         name = self.first_name or ''
@@ -17,7 +57,17 @@ class ContextUser(sqlalchemy_to_pydantic(db.User)):  # type: ignore
         return name
 
 
-class ContextChallenge(sqlalchemy_to_pydantic(db.Challenge)):  # type: ignore
+class ContextChallenge(ContextModel):
+    __slots__ = _get_fields(db.Challenge)
+
+    id: int
+    created_at: datetime.datetime
+    name: str
+    phase_amount: int
+    winner_amount: int
+    duration: datetime.timedelta
+    finished_at: Optional[datetime.datetime]
+
     @property
     def finished(self) -> bool:
         return self.finished_at is not None
@@ -31,18 +81,46 @@ class ContextChallenge(sqlalchemy_to_pydantic(db.Challenge)):  # type: ignore
         return not self.finished and self.finish_after.total_seconds() < 0
 
 
-class ContextResult(sqlalchemy_to_pydantic(db.Result)):  # type: ignore
-    pass
+class ContextResult(ContextModel):
+    __slots__ = _get_fields(db.Result)
+
+    id: int
+    created_at: Optional[datetime.datetime]
+    participant_id: int
+    phase: int
+    finished_at: Optional[datetime.datetime]
 
 
-class ContextParticipant(sqlalchemy_to_pydantic(db.Participant)):  # type: ignore
+_PARTICIPANT_FIELDS = _get_fields(db.Participant)
+
+
+class ContextParticipant(ContextModel):
+    __slots__ = _PARTICIPANT_FIELDS + ('user', 'challenge')
+
+    id: int
+    created_at: Optional[datetime.datetime]
+    user_id: int
+    challenge_id: int
+    finished_at: Optional[datetime.datetime]
+    scores: int
+    current_phase: Optional[int]
+    current_result_id: Optional[int]
     user: ContextUser
     challenge: ContextChallenge
 
+    @classmethod
+    def from_orm(cls, obj: Any) -> 'ContextParticipant':
+        values = {name: getattr(obj, name) for name in _PARTICIPANT_FIELDS}
+        return cls(user=ContextUser.from_orm(obj.user), challenge=ContextChallenge.from_orm(obj.challenge), **values)
+
     @property
     def completed_challenge(self) -> bool:
         return self.finished_at is not None
 
 
-class ContextMessage(sqlalchemy_to_pydantic(db.Message)):  # type: ignore
-    pass
+class ContextMessage(ContextModel):
+    __slots__ = _get_fields(db.Message)
+
+    id: int
+    created_at: Optional[datetime.datetime]
+    text: str
@@ -1,4 +1,5 @@
 import enum
+from dataclasses import dataclass
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
@@ -6,7 +7,7 @@ from typing import Any, Dict, List, Optional, Sequence, Set, Union
 
 from pydantic import BaseModel, conint, root_validator, validator
 from pydantic.datetime_parse import timedelta
-from quiz_bot.entity.context_models import ContextUser
+from quiz_bot.entity.context_models import ContextChallenge, ContextParticipant, ContextResult, ContextUser
 from quiz_bot.entity.errors import PictureNotExistError
 from quiz_bot.path import get_path_settings
 
@@ -43,6 +44,16 @@ class PictureLocation(str, enum.Enum):
     BELOW = "below"
 
 
+class BufferOverflowPolicy(str, enum.Enum):
+    DROP = "drop"  # New items are dropped while buffer is full
+    BLOCK = "block"  # Writer waits until buffer has free space
+
+
+class CloudSource(str, enum.Enum):
+    ALL = "all"  # Frequencies of words of all messages, maintained on saving
+    RECENT = "recent"  # Words of recent messages, counted on every refresh
+
+
 class PictureModel(BaseModel):
     file: Path
     location: PictureLocation
@@ -73,6 +84,7 @@ class RegularChallengeInfo(BaseChallengeInfo):
 
     questions: List[str]
     answers: List[Union[str, Set[str]]]
+    max_typos: conint(ge=0) = 0  # type: ignore
 
     @root_validator
     def validate_questions_and_answers(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -154,26 +166,39 @@ class StoryPatternValue(str, enum.Enum):
     USERNAME = "username"
 
 
-class AnswerEvaluation(BaseModel):
+@dataclass(frozen=True)
+class AnswerEvaluation:
     status: EvaluationStatus
-    replies: List[str] = []
+    replies: Sequence[str] = ()
     quiz_state: QuizState = QuizState.IN_PROGRESS
-    picture: Optional[PictureModel]
-
-    @validator('replies')
-    def validate_replies(cls, v: List[str], values: Dict[str, Any]) -> List[str]:
-        if values.get('status') is EvaluationStatus.CORRECT and not v:
-            raise ValueError("Correct answer should contain at least one reply!")
-        return v
+    picture: Optional[PictureModel] = None
 
 
-class CheckedResult(BaseModel):
+@dataclass(frozen=True)
+class CheckedResult:
     correct: bool
     next_phase: Optional[int]
 
 
+@dataclass(frozen=True)
+class ChallengeSummary:
+    challenge: ContextChallenge
+    participants: int
+    pretenders: int
+    max_scores: Optional[int]
+
+
+@dataclass(frozen=True)
+class PlayerSnapshot:
+    participant: ContextParticipant
+    result: Optional[ContextResult]
+
+
 class WinnerResult(BaseModel):
     user: ContextUser
     position: int
     scores: int
     finished_at: datetime
+
+    class Config:
+        arbitrary_types_allowed = True
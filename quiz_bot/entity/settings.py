@@ -2,12 +2,19 @@ import datetime
 import logging
 import socket
 from random import choice
-from typing import List, Mapping, Optional, Sequence, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Union
 
 import pytz
-from pydantic import BaseSettings, conint, validator
+from pydantic import BaseSettings, confloat, conint, validator
 from quiz_bot.entity.context_models import ContextChallenge
-from quiz_bot.entity.objects import BaseChallengeInfo, RegularChallengeInfo, StoryChallengeInfo, WinnerResult
+from quiz_bot.entity.objects import (
+    BaseChallengeInfo,
+    BufferOverflowPolicy,
+    CloudSource,
+    RegularChallengeInfo,
+    StoryChallengeInfo,
+    WinnerResult,
+)
 from quiz_bot.entity.types import AnyChallengeInfo
 from quiz_bot.utils import display_time
 from sqlalchemy.engine import Engine, engine_from_config
@@ -22,6 +29,7 @@ class LoggingSettings(BaseSettings):
     level: str = logging.getLevelName(logging.INFO)
     format: str = "%(asctime)s [%(levelname)s] [%(name)s:%(lineno)s]  %(message)s"
     datefmt: str = "%H:%M:%S %d-%m-%Y"
+    metrics_interval: Optional[confloat(gt=0)] = 60  # type: ignore
 
     class Config:
         env_prefix = 'LOG_'
@@ -48,13 +56,65 @@ class ShoutboxSettings(BaseSettings):
 class RemoteClientSettings(BaseSettings):
     token: str
     threads_num: conint(ge=1) = 2  # type: ignore
+    async_workers: conint(ge=1) = 64  # type: ignore
     read_timeout: int = 5
     poll_timeout: int = 60
+    api_url: str = 'https://api.telegram.org'
+
+    webhook_url: Optional[str]
+    webhook_host: str = '0.0.0.0'
+    webhook_port: int = 8443
+    webhook_secret: Optional[str]
+
+    send_workers: conint(ge=1) = 8  # type: ignore
+    send_attempts: conint(ge=1) = 3  # type: ignore
+    send_rate_limit: confloat(gt=0) = 30  # type: ignore
+    chat_send_rate_limit: confloat(gt=0) = 1  # type: ignore
+    chat_send_burst: conint(ge=1) = 3  # type: ignore
+    broadcast_rate_share: confloat(gt=0, lt=1) = 0.3  # type: ignore
+
+    @validator('webhook_secret', always=True)
+    def validate_webhook_secret(cls, v: Optional[str], values: Dict[str, Any]) -> Optional[str]:
+        if values.get('webhook_url') is not None and not v:
+            raise ValueError("Webhook secret should be set for webhook URL!")
+        return v
+
+    @property
+    def interactive_rate_limit(self) -> float:
+        """ Part of `send_rate_limit` for replies of bot process. """
+        return float(self.send_rate_limit * (1 - self.broadcast_rate_share))
+
+    @property
+    def broadcast_rate_limit(self) -> float:
+        """ Part of `send_rate_limit` for notifications, which are sent by separate CLI process. """
+        return float(self.send_rate_limit * self.broadcast_rate_share)
+
+    @property
+    def bot_api_url(self) -> str:
+        return f"{self.api_url}/bot{{0}}/{{1}}"
+
+    @property
+    def webhook_enabled(self) -> bool:
+        return self.webhook_url is not None
+
+    @property
+    def webhook_path(self) -> str:
+        return URL(self.webhook_url).path if self.webhook_url is not None else '/'
 
     class Config:
         env_prefix = 'REMOTE_'
 
 
+class BroadcastSettings(BaseSettings):
+    rate_limit: Optional[confloat(gt=0)]  # type: ignore
+    jitter: confloat(ge=0, le=1) = 0  # type: ignore
+    max_pending: conint(ge=1) = 1000  # type: ignore
+    progress_interval: confloat(gt=0) = 1  # type: ignore
+
+    class Config:
+        env_prefix = 'BROADCAST_'
+
+
 class SymbolReplacementSettings(BaseSettings):
     mapping: Mapping[str, str] = {"ё": "е"}
 
@@ -132,6 +192,8 @@ class InfoSettings(BaseSettings):
 class ChallengeSettings(BaseSettings):
     autostart: bool = False
     timezone: str = 'Asia/Yekaterinburg'
+    state_cache_ttl: datetime.timedelta = datetime.timedelta(seconds=30)
+    verdict_cache_size: int = 10000
     challenges: List[Union[RegularChallengeInfo, StoryChallengeInfo]]
 
     start_notification: str = "Для тебя начинается испытание #<b>{number}</b> <b>{name}</b>! <i>{description}</i>"
@@ -246,4 +308,45 @@ class DataBaseSettings(BaseSettings):
 
 
 class MessageCloudSettings(BaseSettings):
-    select_limit: int = 100
+    cloud_source: CloudSource = CloudSource.ALL
+    select_limit: Optional[conint(ge=1)] = 100  # type: ignore
+    select_window: Optional[datetime.timedelta]
+    stream: bool = False
+    stream_batch_size: conint(ge=1) = 1000  # type: ignore
+    refresh_interval: confloat(gt=0) = 30  # type: ignore
+    max_words: conint(ge=1) = 200  # type: ignore
+    words_retention: conint(ge=1) = 10000  # type: ignore
+    min_word_length: conint(ge=1) = 3  # type: ignore
+    stopwords: Set[str] = {
+        "без", "был", "была", "были", "было", "быть", "вас", "вот", "все", "всё", "вы", "где", "да", "для", "его",
+        "ее", "её", "если", "есть", "еще", "ещё", "же", "или", "как", "когда", "кто", "мне", "может", "мой", "нас",
+        "нет", "них", "но", "она", "они", "оно", "от", "по", "под", "при", "так", "там", "тебе", "тебя", "то",
+        "только", "тут", "уже", "что", "чтобы", "это", "этот", "and", "are", "for", "not", "the", "this", "with",
+        "you",
+    }
+
+
+class MessageBufferSettings(BaseSettings):
+    max_size: conint(ge=1) = 10000  # type: ignore
+    flush_size: conint(ge=1) = 500  # type: ignore
+    flush_interval: confloat(gt=0) = 1  # type: ignore
+    overflow_policy: BufferOverflowPolicy = BufferOverflowPolicy.DROP
+
+    class Config:
+        env_prefix = 'MESSAGE_BUFFER_'
+
+
+class UserStorageSettings(BaseSettings):
+    cache_size: int = 10000
+    cache_ttl: int = 600
+    batch_size: conint(ge=1) = 1000  # type: ignore
+
+    class Config:
+        env_prefix = 'USER_'
+
+
+class StatisticsSettings(BaseSettings):
+    cache_ttl: confloat(gt=0) = 5  # type: ignore
+
+    class Config:
+        env_prefix = 'STATISTICS_'
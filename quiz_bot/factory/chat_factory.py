@@ -1,7 +1,7 @@
 from functools import cached_property
 
 from quiz_bot.clients import RemoteBotClient
-from quiz_bot.entity import RemoteClientSettings
+from quiz_bot.entity import RemoteClientSettings, UserStorageSettings
 from quiz_bot.quiz.interfaces import ChatInterface
 from quiz_bot.storage import IUserStorage, UserStorage
 
@@ -12,11 +12,12 @@ class ChatFactory:
 
     @cached_property
     def _remote_bot_client(self) -> RemoteBotClient:
-        return RemoteBotClient(RemoteClientSettings())
+        settings = RemoteClientSettings()
+        return RemoteBotClient(settings, rate_limit=settings.interactive_rate_limit)
 
     @cached_property
     def _user_storage(self) -> IUserStorage:
-        return UserStorage()
+        return UserStorage(UserStorageSettings())
 
     @cached_property
     def interface(self) -> ChatInterface:
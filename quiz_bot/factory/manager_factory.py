@@ -1,12 +1,16 @@
 from functools import cached_property
+from typing import Optional
 
-from quiz_bot.clients import RemoteBotClient, ShoutboxClient
+from quiz_bot.clients import Broadcaster, RemoteBotClient, ShoutboxClient
 from quiz_bot.entity import (
+    BroadcastSettings,
     ChallengeSettings,
     InfoSettings,
+    LoggingSettings,
     RemoteClientSettings,
     ShoutboxSettings,
     SymbolReplacementSettings,
+    UserStorageSettings,
 )
 from quiz_bot.quiz import ChallengeKeeper, ChallengeMaster, QuizManager, QuizNotifier, Registrar, UserMarkupMaker
 from quiz_bot.storage import (
@@ -14,19 +18,27 @@ from quiz_bot.storage import (
     ChallengeStorage,
     IAttemptsStorage,
     IChallengeStorage,
+    IProgressStorage,
     IResultStorage,
-    IUserStorage,
     ParticipantStorage,
+    ProgressStorage,
     ResultStorage,
     UserStorage,
 )
+from quiz_bot.utils import MetricsReporter
 
 
 class QuizManagerFactory:
     def __init__(self, challenge_settings: ChallengeSettings, shoutbox_settings: ShoutboxSettings) -> None:
         self._challenge_settings = challenge_settings
         self._shoutbox_settings = shoutbox_settings
-        self._remote_bot_client = RemoteBotClient(RemoteClientSettings())
+        self._remote_client_settings = RemoteClientSettings()
+        self._remote_bot_client = RemoteBotClient(self._remote_client_settings, rate_limit=self._send_rate_limit)
+
+    @property
+    def _send_rate_limit(self) -> float:
+        """ Management commands are run in separate process, they send notifications only. """
+        return self._remote_client_settings.broadcast_rate_limit
 
     @cached_property
     def _info_settings(self) -> InfoSettings:
@@ -37,8 +49,8 @@ class QuizManagerFactory:
         return ShoutboxClient(self._shoutbox_settings)
 
     @cached_property
-    def _user_storage(self) -> IUserStorage:
-        return UserStorage()
+    def _user_storage(self) -> UserStorage:
+        return UserStorage(UserStorageSettings())
 
     @cached_property
     def _attempts_storage(self) -> IAttemptsStorage:
@@ -52,13 +64,22 @@ class QuizManagerFactory:
     def _result_storage(self) -> IResultStorage:
         return ResultStorage()
 
+    @cached_property
+    def _progress_storage(self) -> IProgressStorage:
+        return ProgressStorage()
+
     @cached_property
     def _registrar(self) -> Registrar:
-        return Registrar(storage=ParticipantStorage())
+        return Registrar(storage=ParticipantStorage(), progress_storage=self._progress_storage)
 
     @cached_property
     def _challenge_keeper(self) -> ChallengeKeeper:
-        return ChallengeKeeper(result_storage=self._result_storage, symbol_settings=SymbolReplacementSettings())
+        return ChallengeKeeper(
+            result_storage=self._result_storage,
+            progress_storage=self._progress_storage,
+            symbol_settings=SymbolReplacementSettings(),
+            verdict_cache_size=self._challenge_settings.verdict_cache_size,
+        )
 
     @cached_property
     def challenge_master(self) -> ChallengeMaster:
@@ -84,11 +105,22 @@ class QuizManagerFactory:
             challenge_master=self.challenge_master,
         )
 
+    @cached_property
+    def metrics_reporter(self) -> Optional[MetricsReporter]:
+        interval = LoggingSettings().metrics_interval
+        if interval is None:
+            return None
+        reporter = MetricsReporter(interval=interval)
+        reporter.add('identity cache', lambda: self._user_storage.identity_cache.metrics)
+        reporter.add('verdict cache', lambda: self._challenge_keeper.verdict_cache.metrics)
+        reporter.add('send queue', lambda: self._remote_bot_client.send_metrics)
+        return reporter
+
     @cached_property
     def notifier(self) -> QuizNotifier:
         return QuizNotifier(
             user_storage=self._user_storage,
-            remote_client=self._remote_bot_client,
+            broadcaster=Broadcaster(client=self._remote_bot_client, settings=BroadcastSettings()),
             settings=self._info_settings,
             markup_maker=self._interface_maker,
             challenge_master=self.challenge_master,
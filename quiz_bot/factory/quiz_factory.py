@@ -1,19 +1,47 @@
 from functools import cached_property
 
-from quiz_bot.entity import MessageCloudSettings
+from quiz_bot.clients import AsyncRemoteBotClient
+from quiz_bot.entity import MessageBufferSettings, MessageCloudSettings
 from quiz_bot.factory.manager_factory import QuizManagerFactory
 from quiz_bot.quiz import QuizInterface
-from quiz_bot.quiz.interfaces import IInterface
-from quiz_bot.storage import IMessageStorage, MessageStorage
+from quiz_bot.quiz.interfaces import AsyncQuizInterface, IInterface
+from quiz_bot.storage import BufferedMessageStorage, MessageStorage
 
 
 class QuizInterfaceFactory(QuizManagerFactory):
+    @property
+    def _send_rate_limit(self) -> float:
+        return self._remote_client_settings.interactive_rate_limit
+
     @cached_property
-    def _message_storage(self) -> IMessageStorage:
-        return MessageStorage(MessageCloudSettings())
+    def _message_storage(self) -> BufferedMessageStorage:
+        return BufferedMessageStorage(MessageStorage(MessageCloudSettings()), settings=MessageBufferSettings())
 
     @cached_property
-    def interface(self) -> IInterface:
+    def _quiz_interface(self) -> QuizInterface:
         return QuizInterface(
             client=self._remote_bot_client, manager=self.manager, message_storage=self._message_storage
         )
+
+    @cached_property
+    def interface(self) -> IInterface:
+        return self._quiz_interface
+
+    @cached_property
+    def _async_remote_bot_client(self) -> AsyncRemoteBotClient:
+        client = AsyncRemoteBotClient(self._remote_client_settings)
+        if self.metrics_reporter is not None:
+            self.metrics_reporter.add('async send queue', lambda: client.send_metrics)
+        return client
+
+    @cached_property
+    def async_interface(self) -> AsyncQuizInterface:
+        return AsyncQuizInterface(
+            client=self._async_remote_bot_client,
+            interface=self._quiz_interface,
+            settings=self._remote_client_settings,
+        )
+
+    def close(self) -> None:
+        """ Save buffered messages, should be called on shutdown of the bot. """
+        self._message_storage.close()
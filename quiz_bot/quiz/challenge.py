@@ -71,7 +71,7 @@ class ChallengeMaster:
             raise ChallengeNotFoundError("Could not found finished challenge - WTF?")
         self._save_challenge_data(challenge)
 
-    def resolve_quiz_state(self) -> QuizState:
+    def _get_synced_state(self) -> QuizState:
         self._sync_challenge()
         if not self._keeper.has_data:
             return QuizState.NEW
@@ -81,6 +81,19 @@ class ChallengeMaster:
             return QuizState.WAIT_NEXT
         return QuizState.IN_PROGRESS
 
+    def resolve_quiz_state(self) -> QuizState:
+        state = self._keeper.cached_state
+        if state is None:
+            state = self._get_synced_state()
+            # Next challenge is started by separate CLI process, so prepared state is always read from storage
+            if not state.prepared:
+                self._keeper.cache_state(state, ttl=self._settings.state_cache_ttl)
+        return state
+
+    def _finish_actual_challenge(self) -> None:
+        self._storage.finish_actual_challenge()
+        self._keeper.invalidate()
+
     def _get_next_challenge_info(self) -> AnyChallengeInfo:
         if not self._keeper.has_data:
             return self._settings.get_challenge_model(1)
@@ -95,11 +108,14 @@ class ChallengeMaster:
             duration=next_challenge_info.duration,
         )
         logger.info("Next challenge: %s", next_challenge)
+        self._keeper.invalidate()
         self._sync_challenge()
 
     def _get_evaluation(
-        self, status: EvaluationStatus, replies: Optional[Sequence[str]] = (), picture: Optional[PictureModel] = None
+        self, status: EvaluationStatus, replies: Sequence[str] = (), picture: Optional[PictureModel] = None
     ) -> AnswerEvaluation:
+        if status is EvaluationStatus.CORRECT and not replies:
+            raise ValueError("Correct answer should contain at least one reply!")
         return AnswerEvaluation(status=status, replies=replies, quiz_state=self.resolve_quiz_state(), picture=picture)
 
     def start_challenge_for_user(
@@ -159,7 +175,7 @@ class ChallengeMaster:
         if not has_all_winners:
             return self._get_evaluation(status=status, replies=pretender_replies)
 
-        self._storage.finish_actual_challenge()
+        self._finish_actual_challenge()
         logger.info(
             "Challenge #%s '%s' finished with all winners resolution!", self._keeper.number, self._keeper.info.name,
         )
@@ -172,7 +188,7 @@ class ChallengeMaster:
 
     def evaluate(self, user: ContextUser, message: telebot.types.Message) -> AnswerEvaluation:  # noqa: C901
         if self._keeper.out_of_date:
-            self._storage.finish_actual_challenge()
+            self._finish_actual_challenge()
 
         participant = self._registrar.get_participation_for_user(user=user, challenge=self._keeper.data)
         if participant is None:
@@ -195,7 +211,6 @@ class ChallengeMaster:
         if not checked_result.correct:
             return self._get_evaluation(status=EvaluationStatus.INCORRECT)
 
-        self._registrar.add_correct_answer(participant)
         logger.info("Added +1 score for user '%s'!", user.nick_name)
         return self._resolve_next_event(participant=participant, result=checked_result)
 
@@ -215,6 +230,8 @@ class ChallengeMaster:
         if context_challenge is None:
             raise ChallengeNotFoundError(f"Challenge with ID {challenge_id} was not found!")
 
+        if not self._keeper.has_data or context_challenge.id != self._keeper.number:
+            self._keeper.invalidate()
         self._save_challenge_data(context_challenge)
         winner_results = self._registrar.get_winners(self._keeper.data)
 
@@ -1,5 +1,6 @@
 import abc
 import logging
+from typing import Callable, Hashable, Optional, Tuple
 
 from quiz_bot.entity import (
     CheckedResult,
@@ -10,50 +11,97 @@ from quiz_bot.entity import (
     TChallengeInfo,
 )
 from quiz_bot.quiz.checkers.abstract_checker import IResultChecker
-from quiz_bot.storage import IResultStorage
-from quiz_bot.utils import get_now
+from quiz_bot.quiz.checkers.matching import TextNormalizer
+from quiz_bot.storage import IProgressStorage, IResultStorage, PhaseAlreadyFinishedError
+from quiz_bot.utils import LRUCache, get_now
 
 logger = logging.getLogger(__name__)
 
+VerdictKey = Tuple[Hashable, ...]
+
 
 class BaseResultChecker(IResultChecker[TChallengeInfo], abc.ABC):
-    def __init__(self, result_storage: IResultStorage, symbol_settings: SymbolReplacementSettings):
+    def __init__(
+        self,
+        result_storage: IResultStorage,
+        progress_storage: IProgressStorage,
+        symbol_settings: SymbolReplacementSettings,
+        verdict_cache: LRUCache[VerdictKey, bool],
+    ):
         self._result_storage = result_storage
+        self._progress_storage = progress_storage
         self._symbol_settings = symbol_settings
+        self._verdict_cache = verdict_cache
+        self._normalizer = TextNormalizer(symbol_settings.mapping)
 
     def _replace_symbols(self, text: str) -> str:
-        for key, value in self._symbol_settings.mapping.items():
-            text = text.replace(key, value)
-        return text
+        return self._normalizer.replace_symbols(text)
+
+    def _get_verdict(self, key: VerdictKey, evaluate: Callable[[], bool]) -> bool:
+        verdict = self._verdict_cache.get(key)
+        if verdict is None:
+            verdict = evaluate()
+            self._verdict_cache.set(key, verdict)
+        return verdict
+
+    def _save_progress(self, participant: ContextParticipant, result: ContextResult) -> None:
+        participant.current_phase = result.phase
+        participant.current_result_id = result.id
+        self._progress_storage.save_participant(participant)
+        self._progress_storage.save_result(result)
 
     def create_initial_phase(self, participant: ContextParticipant) -> ContextResult:
-        return self._result_storage.create_result(participant_id=participant.id, phase=1)
+        result = self._result_storage.create_result(participant_id=participant.id, phase=1)
+        self._save_progress(participant, result)
+        return result
 
-    def _set_phase_finished(self, result: ContextResult) -> None:
-        result.finished_at = get_now()
-        self._result_storage.finish_phase(result=result, finish_time=result.finished_at)
+    def _get_current_result(self, participant: ContextParticipant) -> ContextResult:
+        result = self._progress_storage.get_result(participant.id)
+        if result is None:
+            result = self._result_storage.get_current_result(participant_id=participant.id)
+            self._progress_storage.save_result(result)
+        return result
 
     def _next_result(
-        self, participant: ContextParticipant, data: ContextChallenge, current_result: ContextResult
+        self, participant: ContextParticipant, data: ContextChallenge, current_result: ContextResult, scored: bool
     ) -> CheckedResult:
-        self._set_phase_finished(current_result)
+        next_phase: Optional[int] = None
         if current_result.phase == data.phase_amount:
             logger.debug("CurrentResult phase is equal to ContextChallenge phase_amount, so next_phase is None")
-            return CheckedResult(correct=True)
+        else:
+            next_phase = current_result.phase + 1
+            logger.debug(
+                "Next phase for user '%s' in challenge ID %s is %s", participant.user.nick_name, data.id, next_phase
+            )
 
-        next_phase = current_result.phase + 1
-        logger.debug(
-            "Next phase for user '%s' in challenge ID %s is %s", participant.user.nick_name, data.id, next_phase
-        )
-        self._result_storage.create_result(participant_id=participant.id, phase=next_phase)
+        finish_time = get_now()
+        try:
+            participant.scores, next_result = self._result_storage.advance_phase(
+                result=current_result,
+                finish_time=finish_time,
+                next_phase=next_phase,
+                score_increment=1 if scored else 0,
+            )
+        except PhaseAlreadyFinishedError:
+            logger.warning(
+                "Phase %s of challenge ID %s has already been finished for user '%s', progress is outdated",
+                current_result.phase,
+                data.id,
+                participant.user.nick_name,
+            )
+            self._progress_storage.clear()
+            actual_result = self._result_storage.get_current_result(participant_id=participant.id)
+            return CheckedResult(correct=False, next_phase=actual_result.phase)
+        current_result.finished_at = finish_time
+        self._save_progress(participant, next_result or current_result)
         return CheckedResult(correct=True, next_phase=next_phase)
 
     def skip_question(self, participant: ContextParticipant, data: ContextChallenge) -> CheckedResult:
-        current_result = self._result_storage.get_last_result(participant_id=participant.id)
+        current_result = self._get_current_result(participant)
         logger.info(
             "User '%s' SKIP answer for phase %s, challenge %s",
             participant.user.nick_name,
             current_result.phase,
             data.id,
         )
-        return self._next_result(participant=participant, data=data, current_result=current_result,)
+        return self._next_result(participant=participant, data=data, current_result=current_result, scored=False)
@@ -0,0 +1,81 @@
+import re
+import unicodedata
+from typing import Iterable, List, Mapping, Optional, Pattern, Tuple
+
+
+class TextNormalizer:
+    """ Prepares texts for matching: NFKC, casefold and precomputed symbol replacements. """
+
+    def __init__(self, mapping: Mapping[str, str]) -> None:
+        self._table = str.maketrans({key: value for key, value in mapping.items() if len(key) == 1})
+        self._replacements: List[Tuple[str, str]] = [
+            (key, value) for key, value in mapping.items() if len(key) != 1
+        ]
+
+    def replace_symbols(self, text: str) -> str:
+        text = text.translate(self._table)
+        for key, value in self._replacements:
+            text = text.replace(key, value)
+        return text
+
+    def normalize(self, text: str) -> str:
+        return self.replace_symbols(unicodedata.normalize('NFKC', text).casefold()).strip()
+
+
+def strip_punctuation(text: str) -> str:
+    return " ".join("".join(x for x in text if not unicodedata.category(x).startswith('P')).split())
+
+
+def has_fuzzy_occurrence(pattern: str, text: str, max_distance: int) -> bool:
+    """ Whether `pattern` occurs in `text` with at most `max_distance` edits.
+    Sellers algorithm with Ukkonen cut-off, so only O(max_distance) cells are computed per text symbol. """
+    size = len(pattern)
+    if size <= max_distance:
+        return True
+    limit = max_distance + 1
+    column = [min(i, limit) for i in range(size + 1)]
+    last_active = max_distance
+    for symbol in text:
+        diagonal = 0
+        bound = min(last_active + 1, size)
+        for i in range(1, bound + 1):
+            left = column[i]
+            column[i] = min(left + 1, column[i - 1] + 1, diagonal + (pattern[i - 1] != symbol), limit)
+            diagonal = left
+        last_active = bound
+        while column[last_active] > max_distance:
+            last_active -= 1
+        if last_active == size:
+            return True
+    return False
+
+
+# One typo is allowed for every this number of symbols of expectation, so short ones are matched exactly
+_SYMBOLS_PER_TYPO = 5
+
+
+class AnswerMatcher:
+    """ Searches any of normalized expectations in normalized answer with one compiled pattern.
+    With `max_typos` expectations also could be found with limited number of edits, ignoring punctuation.
+    Empty expectations are skipped, so matcher without variants does not match any answer. """
+
+    def __init__(self, expectations: Iterable[str], max_typos: int = 0) -> None:
+        variants = sorted({x for x in expectations if x}, key=len, reverse=True)
+        self._pattern: Optional[Pattern[str]] = None
+        if variants:
+            self._pattern = re.compile("|".join(re.escape(x) for x in variants))
+        self._fuzzy_variants: List[Tuple[str, int]] = []
+        for variant in map(strip_punctuation, variants):
+            typos = min(max_typos, len(variant) // _SYMBOLS_PER_TYPO)
+            if typos > 0:
+                self._fuzzy_variants.append((variant, typos))
+
+    def match(self, answer: str) -> bool:
+        if self._pattern is None:
+            return False
+        if self._pattern.search(answer) is not None:
+            return True
+        if not self._fuzzy_variants:
+            return False
+        answer = strip_punctuation(answer)
+        return any(has_fuzzy_occurrence(x, answer, typos) for x, typos in self._fuzzy_variants)
@@ -1,29 +1,54 @@
 import logging
-import re
-from typing import Match, Optional, Set
+from typing import Dict, List, Tuple
 
 import telebot
-from quiz_bot.entity import CheckedResult, ContextChallenge, ContextParticipant, RegularChallengeInfo
-from quiz_bot.quiz.checkers.base_checker import BaseResultChecker
+from quiz_bot.entity import (
+    CheckedResult,
+    ContextChallenge,
+    ContextParticipant,
+    RegularChallengeInfo,
+    SymbolReplacementSettings,
+)
+from quiz_bot.quiz.checkers.base_checker import BaseResultChecker, VerdictKey
+from quiz_bot.quiz.checkers.matching import AnswerMatcher
+from quiz_bot.storage import IProgressStorage, IResultStorage
+from quiz_bot.utils import LRUCache
 
 logger = logging.getLogger(__name__)
 
 
-class AnswerMatchingMixin:
-    @staticmethod
-    def _prepare_for_matching(text: str) -> str:
-        return text.strip().lower()
-
-    @classmethod
-    def _search(cls, answer: str, expectation: str) -> Optional[Match[str]]:
-        return re.search(rf"({cls._prepare_for_matching(expectation)})+", cls._prepare_for_matching(answer))
-
-    @classmethod
-    def _match(cls, answer: str, expectations: Set[str]) -> bool:
-        return any(cls._search(answer, expectation) for expectation in expectations)
+class RegularResultChecker(BaseResultChecker[RegularChallengeInfo]):
+    def __init__(
+        self,
+        result_storage: IResultStorage,
+        progress_storage: IProgressStorage,
+        symbol_settings: SymbolReplacementSettings,
+        verdict_cache: LRUCache[VerdictKey, bool],
+    ):
+        super().__init__(
+            result_storage=result_storage,
+            progress_storage=progress_storage,
+            symbol_settings=symbol_settings,
+            verdict_cache=verdict_cache,
+        )
+        self._matchers: Dict[int, Tuple[RegularChallengeInfo, List[AnswerMatcher]]] = {}
 
+    def _get_matcher(self, info: RegularChallengeInfo, phase: int) -> AnswerMatcher:
+        """ Matchers of all phases are compiled once per challenge info object, so infos with equal names
+        could not share them. The info is kept with its matchers, so its identity could not be reused. """
+        compiled = self._matchers.get(id(info))
+        if compiled is None or compiled[0] is not info:
+            matchers = [
+                AnswerMatcher(
+                    (self._normalizer.normalize(x) for x in info.get_answer_variants(number)),
+                    max_typos=info.max_typos,
+                )
+                for number in range(1, info.phase_amount + 1)
+            ]
+            compiled = (info, matchers)
+            self._matchers[id(info)] = compiled
+        return compiled[1][phase - 1]
 
-class RegularResultChecker(BaseResultChecker[RegularChallengeInfo], AnswerMatchingMixin):
     def check_answer(
         self,
         participant: ContextParticipant,
@@ -31,16 +56,20 @@ class RegularResultChecker(BaseResultChecker[RegularChallengeInfo], AnswerMatchi
         info: RegularChallengeInfo,
         message: telebot.types.Message,
     ) -> CheckedResult:
-        current_result = self._result_storage.get_last_result(participant_id=participant.id)
-        expectations = {self._replace_symbols(x) for x in info.get_answer_variants(current_result.phase)}
-        if not self._match(answer=self._replace_symbols(message.text), expectations=expectations):
+        current_result = self._get_current_result(participant)
+        answer = self._normalizer.normalize(message.text)
+        correct = self._get_verdict(
+            key=(data.id, current_result.phase, answer),
+            evaluate=lambda: self._get_matcher(info, current_result.phase).match(answer),
+        )
+        if not correct:
             logger.debug(
                 "User '%s' given incorrect answer for phase %s, challenge %s",
                 participant.user.nick_name,
                 current_result.phase,
                 data.id,
             )
-            return CheckedResult(correct=False, finish_condition_reached=False, next_phase=current_result.phase)
+            return CheckedResult(correct=False, next_phase=current_result.phase)
 
         logger.info(
             "User '%s' given CORRECT answer for phase %s, challenge %s",
@@ -48,4 +77,4 @@ class RegularResultChecker(BaseResultChecker[RegularChallengeInfo], AnswerMatchi
             current_result.phase,
             data.id,
         )
-        return self._next_result(participant=participant, data=data, current_result=current_result,)
+        return self._next_result(participant=participant, data=data, current_result=current_result, scored=True)
@@ -1,10 +1,9 @@
 import enum
 import logging
 import re
-from typing import Dict, List, Match, Optional, Pattern, Sequence
+from typing import Dict, List, Pattern, Sequence
 
 import telebot
-from pydantic import BaseModel
 from quiz_bot.entity import (
     CheckedResult,
     ContextChallenge,
@@ -12,8 +11,12 @@ from quiz_bot.entity import (
     StoryChallengeInfo,
     StoryItem,
     StoryPatternValue,
+    SymbolReplacementSettings,
 )
-from quiz_bot.quiz.checkers.base_checker import BaseResultChecker
+from quiz_bot.quiz.checkers.base_checker import BaseResultChecker, VerdictKey
+from quiz_bot.quiz.checkers.matching import TextNormalizer
+from quiz_bot.storage import IProgressStorage, IResultStorage
+from quiz_bot.utils import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,19 +27,80 @@ class StoryPatternDelimiter(str, enum.Enum):
 
 
 def _compile_pattern(keyword: str) -> Pattern[str]:
-    return re.compile(rf"({StoryPatternDelimiter.LEFT}{keyword}{StoryPatternDelimiter.RIGHT})+")
+    return re.compile(rf"({StoryPatternDelimiter.LEFT.value}{keyword}{StoryPatternDelimiter.RIGHT.value})+")
 
 
 _KEYWORD_TO_PATTERN_MAPPING: Dict[StoryPatternValue, Pattern[str]] = {
     x: _compile_pattern(x.value) for x in list(StoryPatternValue)
 }
 
+_USER_PATTERNS_CACHE_SIZE = 1024
 
-class PatternMatchingModel(BaseModel):
-    participant: ContextParticipant
+
+def _compile_expectations(*expectations: str) -> Pattern[str]:
+    return re.compile("|".join(f"(?:{x})" for x in expectations), re.I)
+
+
+class StoryLineMatcher:
+    """ Compiled expectations of one story item, text pattern is specialized and cached per user. """
+
+    def __init__(self, item: StoryItem, normalizer: TextNormalizer) -> None:
+        self._normalizer = normalizer
+        steps = (item.step.value, *(x.value for x in item.iterable_prepositions))
+        self._step = _compile_expectations(*(normalizer.replace_symbols(x) for x in steps))
+        self._construction = _compile_expectations(normalizer.replace_symbols(item.construction))
+        self._text = item.text
+        self._text_patterns: LRUCache[str, Pattern[str]] = LRUCache(maxsize=_USER_PATTERNS_CACHE_SIZE)
+
+    def _get_text_pattern(self, nick_name: str) -> Pattern[str]:
+        pattern = self._text_patterns.get(nick_name)
+        if pattern is None:
+            text = _KEYWORD_TO_PATTERN_MAPPING[StoryPatternValue.USERNAME].sub(
+                lambda _: re.escape(nick_name), self._text
+            )
+            pattern = _compile_expectations(self._normalizer.replace_symbols(text))
+            self._text_patterns.set(nick_name, pattern)
+        return pattern
+
+    def match(self, line: str, nick_name: str) -> bool:
+        return bool(
+            self._step.search(line)
+            and self._construction.search(line)
+            and self._get_text_pattern(nick_name).search(line)
+        )
+
+
+class StoryMatcher:
+    def __init__(self, items: Sequence[StoryItem], normalizer: TextNormalizer) -> None:
+        self._lines = [StoryLineMatcher(item, normalizer) for item in items]
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def match(self, lines: Sequence[str], nick_name: str) -> bool:
+        for line_matcher, line_value in zip(self._lines, lines):
+            if not line_matcher.match(line_value, nick_name):
+                logger.debug("-> Line '%s' does not match!", line_value)
+                return False
+        return True
 
 
 class StoryResultChecker(BaseResultChecker[StoryChallengeInfo]):
+    def __init__(
+        self,
+        result_storage: IResultStorage,
+        progress_storage: IProgressStorage,
+        symbol_settings: SymbolReplacementSettings,
+        verdict_cache: LRUCache[VerdictKey, bool],
+    ):
+        super().__init__(
+            result_storage=result_storage,
+            progress_storage=progress_storage,
+            symbol_settings=symbol_settings,
+            verdict_cache=verdict_cache,
+        )
+        self._matchers: Dict[str, StoryMatcher] = {}
+
     def check_answer(
         self,
         participant: ContextParticipant,
@@ -44,26 +108,32 @@ class StoryResultChecker(BaseResultChecker[StoryChallengeInfo]):
         info: StoryChallengeInfo,
         message: telebot.types.Message,
     ) -> CheckedResult:
-        current_result = self._result_storage.get_last_result(participant_id=participant.id)
-        if not self._match(answer=message.text, items=info.items, participant=participant):
+        current_result = self._get_current_result(participant)
+        if not self._match(answer=message.text, info=info, participant=participant):
             logger.debug(
                 "User '%s' given incorrect story for challenge %s", participant.user.nick_name, data.id,
             )
-            return CheckedResult(correct=False, finish_condition_reached=False, next_phase=current_result.phase)
+            return CheckedResult(correct=False, next_phase=current_result.phase)
 
         logger.info(
             "User '%s' given CORRECT story for challenge %s", participant.user.nick_name, data.id,
         )
-        return self._next_result(participant=participant, data=data, current_result=current_result,)
+        return self._next_result(participant=participant, data=data, current_result=current_result, scored=True)
 
-    @staticmethod
-    def _prepare_for_matching(text: str) -> List[str]:
-        return [x for x in text.strip().lower().split("\n") if x]
+    def _get_matcher(self, info: StoryChallengeInfo) -> StoryMatcher:
+        matcher = self._matchers.get(info.name)
+        if matcher is None:
+            matcher = StoryMatcher(info.items, self._normalizer)
+            self._matchers[info.name] = matcher
+        return matcher
+
+    def _prepare_for_matching(self, text: str) -> List[str]:
+        return [x for x in self._replace_symbols(text.strip().lower()).split("\n") if x]
 
     @staticmethod
-    def _lines_number_equal(answer_lines: Sequence[str], expected_items: Sequence[StoryItem]) -> bool:
+    def _lines_number_equal(answer_lines: Sequence[str], matcher: StoryMatcher) -> bool:
         lines_len = len(answer_lines)
-        items_len = len(expected_items)
+        items_len = len(matcher)
         if lines_len != items_len:
             logger.debug(
                 "Not equal number of user lines and expected items: %s against %s!", lines_len, items_len,
@@ -71,49 +141,10 @@ class StoryResultChecker(BaseResultChecker[StoryChallengeInfo]):
             return False
         return True
 
-    @staticmethod
-    def _replace_patterns(text: str, matching_model: PatternMatchingModel) -> str:
-        for key, value in _KEYWORD_TO_PATTERN_MAPPING.items():
-            if key is StoryPatternValue.USERNAME:
-                return value.sub(matching_model.participant.user.nick_name, text)
-        return text
-
-    def _search(
-        self, answer: str, expectation: str, matching_model: Optional[PatternMatchingModel] = None
-    ) -> Optional[Match[str]]:
-        if matching_model is not None:
-            expectation = self._replace_patterns(text=expectation, matching_model=matching_model)
-
-        answer = self._replace_symbols(answer)
-        expectation = self._replace_symbols(expectation)
-
-        logger.debug("--> Try to search '%s' in '%s'...", expectation, answer)
-        result = re.search(rf"({expectation})+", answer, re.I)
-        logger.debug("--> Match result: %s", str(result).upper())
-        return result
-
-    def _match(self, answer: str, items: Sequence[StoryItem], participant: ContextParticipant) -> bool:
+    def _match(self, answer: str, info: StoryChallengeInfo, participant: ContextParticipant) -> bool:
+        matcher = self._get_matcher(info)
         lines = self._prepare_for_matching(answer)
-        if not self._lines_number_equal(lines, items):
+        if not self._lines_number_equal(lines, matcher):
             return False
         logger.debug("Lines are equal! Try to match answer with expectation...")
-        for line_num, line_value in enumerate(lines):
-            logger.debug("-> Line '%s'", line_value)
-            if all(
-                (
-                    self._search(line_value, items[line_num].step.value)
-                    or any(
-                        preposition
-                        for preposition in items[line_num].iterable_prepositions
-                        if self._search(line_value, preposition)
-                    ),
-                    self._search(line_value, items[line_num].construction),
-                    self._search(
-                        line_value, items[line_num].text, matching_model=PatternMatchingModel(participant=participant)
-                    ),
-                )
-            ):
-                continue
-            logger.debug("-> Line '%s' does not match!", line_value)
-            return False
-        return True
+        return matcher.match(lines, participant.user.nick_name or '')
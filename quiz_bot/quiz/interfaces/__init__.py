@@ -2,3 +2,4 @@
 from .abstract_interface import IInterface
 from .chat_interface import ChatInterface
 from .quiz_interface import QuizInterface
+from .async_interface import AsyncQuizInterface
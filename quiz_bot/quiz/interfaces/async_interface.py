@@ -0,0 +1,88 @@
+import asyncio
+import collections
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Optional, Tuple
+
+import telebot
+from quiz_bot.clients import SendMessageError
+from quiz_bot.clients.telegram_async import AsyncRemoteBotClient
+from quiz_bot.entity import RemoteClientSettings
+from quiz_bot.quiz.interfaces.quiz_interface import QuizInterface, ResponseFunc
+from quiz_bot.quiz.objects import ContentType
+
+logger = logging.getLogger(__name__)
+
+ChatTask = Tuple[telebot.types.Message, Optional[str]]
+
+
+class AsyncQuizInterface:
+    """ Asyncio runtime for QuizInterface: long polling and sending are asynchronous,
+    blocking storage work is made in bounded executor, updates of every chat are processed in order. """
+
+    def __init__(self, client: AsyncRemoteBotClient, interface: QuizInterface, settings: RemoteClientSettings) -> None:
+        self._client = client
+        self._interface = interface
+        self._executor = ThreadPoolExecutor(max_workers=settings.async_workers, thread_name_prefix='quiz-worker')
+        self._queues: Dict[int, Deque[ChatTask]] = {}
+        self._workers: Dict[int, 'asyncio.Task[None]'] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._workers)
+
+    def run(self) -> None:
+        logger.info('Bot is started in async mode.')
+        try:
+            asyncio.run(self._run_loop())
+        finally:
+            self._executor.shutdown(wait=True)
+
+    async def _run_loop(self) -> None:
+        async with self._client:
+            await self._client.run_loop(self.dispatch)
+
+    def dispatch(self, update: telebot.types.Update) -> None:
+        task: Optional[ChatTask] = None
+        if update.message is not None and update.message.content_type == ContentType.TEXT:
+            task = (update.message, None)
+        elif update.callback_query is not None and update.callback_query.message is not None:
+            query = update.callback_query
+            query.message.text = query.data
+            query.message.from_user = query.from_user
+            task = (query.message, query.id)
+        if task is None:
+            logger.debug("Skip unsupported update #%s", update.update_id)
+            return
+
+        chat_id = task[0].chat.id
+        self._queues.setdefault(chat_id, collections.deque()).append(task)
+        if chat_id not in self._workers:
+            self._workers[chat_id] = asyncio.ensure_future(self._process_chat(chat_id))
+
+    def _get_func(self, message: telebot.types.Message, query_id: Optional[str]) -> ResponseFunc:
+        if query_id is not None:
+            return self._interface.get_callback_func(message.text)
+        return self._interface.get_message_func(message)
+
+    async def _process_chat(self, chat_id: int) -> None:
+        queue = self._queues[chat_id]
+        loop = asyncio.get_running_loop()
+        try:
+            while queue:
+                message, query_id = queue.popleft()
+                try:
+                    func = self._get_func(message, query_id)
+                    if query_id is not None:
+                        await self._client.answer_callback_query(query_id)
+                    response = await loop.run_in_executor(self._executor, self._interface.make_response, message, func)
+                    await self._client.send(response)
+                except SendMessageError:
+                    logger.exception(
+                        "Could not sent reply for user '%s', chat ID '%s'!", message.from_user.username, chat_id
+                    )
+                except Exception:
+                    logger.exception("Error while processing message '%s' from chat ID %s!", message.text, chat_id)
+        finally:
+            del self._queues[chat_id]
+            del self._workers[chat_id]
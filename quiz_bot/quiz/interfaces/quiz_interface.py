@@ -11,6 +11,8 @@ from quiz_bot.storage import IMessageStorage
 
 logger = logging.getLogger(__name__)
 
+ResponseFunc = Callable[[telebot.types.Message], BotResponse]
+
 
 class QuizInterface(BaseInterface):
     def __init__(self, client: RemoteBotClient, manager: QuizManager, message_storage: IMessageStorage) -> None:
@@ -18,11 +20,36 @@ class QuizInterface(BaseInterface):
         self._manager = manager
         self._message_storage = message_storage
 
-    def _process(self, message: telebot.types.Message, func: Callable[[telebot.types.Message], BotResponse]) -> None:
+    def make_response(self, message: telebot.types.Message, func: ResponseFunc) -> BotResponse:
         logger.info("Got '%s' message from chat #%s", message.text, message.chat.id)
+        response = func(message)
+        self._message_storage.save_all(response.replies)
+        return response
+
+    def get_message_func(self, message: telebot.types.Message) -> ResponseFunc:
+        command = telebot.util.extract_command(message.text)
+        if command == ApiCommand.HELP:
+            return self._manager.get_help_response
+        if command == ApiCommand.START:
+            return self._manager.get_start_response
+        if command == ApiCommand.STATUS:
+            return self._manager.get_status_response
+        return self._manager.respond
+
+    def get_callback_func(self, data: str) -> ResponseFunc:
+        if data == ApiCommand.HELP.as_url:
+            return self._manager.get_help_response
+        if data == ApiCommand.START.as_url:
+            return self._manager.get_start_response
+        if data == ApiCommand.STATUS.as_url:
+            return self._manager.get_status_response
+        if data.startswith(ApiCommand.SKIP.as_url):
+            return self._manager.get_skip_response
+        raise NotSupportedCallbackError(f"Unsupported callback query data: {data}!")
+
+    def _process(self, message: telebot.types.Message, func: ResponseFunc) -> None:
         with self._client.thread_lock[message.chat.id]:
-            response = func(message)
-            self._message_storage.save_all(response.replies)
+            response = self.make_response(message, func)
             try:
                 self._client.send(response)
             except SendMessageError:
@@ -47,25 +74,11 @@ class QuizInterface(BaseInterface):
         def default_handler(message: telebot.types.Message) -> None:
             self._process(message, func=self._manager.respond)
 
-        def skip_handler(message: telebot.types.Message) -> None:
-            self._process(message, func=self._manager.get_skip_response)
-
-        def _get_handler_by_data(data: str) -> Callable[[telebot.types.Message], BotResponse]:
-            if data == ApiCommand.HELP.as_url:
-                return help_handler  # type: ignore
-            if data == ApiCommand.START.as_url:
-                return start_handler  # type: ignore
-            if data == ApiCommand.STATUS.as_url:
-                return status_handler  # type: ignore
-            if data.startswith(ApiCommand.SKIP.as_url):
-                return skip_handler  # type: ignore
-            raise NotSupportedCallbackError(f"Unsupported callback query data: {data}!")
-
         @bot.callback_query_handler(func=lambda _: True)
         def markup_callback(query: telebot.types.CallbackQuery) -> None:
             self._client.bot.answer_callback_query(query.id)
             query.message.text = query.data
             query.message.from_user = query.from_user
-            _get_handler_by_data(query.data)(query.message)
+            self._process(query.message, func=self.get_callback_func(query.data))
 
         logger.info("QuizBot API handlers registered.")
@@ -1,11 +1,13 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional, Type, Union, cast
 
-from quiz_bot.entity import ChallengeType, SymbolReplacementSettings
+from quiz_bot.entity import ChallengeType, QuizState, SymbolReplacementSettings
 from quiz_bot.entity.context_models import ContextChallenge
 from quiz_bot.entity.types import AnyChallengeInfo
 from quiz_bot.quiz.checkers import AnyResultChecker, RegularResultChecker, StoryResultChecker
-from quiz_bot.storage import IResultStorage
+from quiz_bot.quiz.checkers.base_checker import VerdictKey
+from quiz_bot.storage import IProgressStorage, IResultStorage
+from quiz_bot.utils import LRUCache, get_now
 
 
 class EmptyChallengeKeeperError(RuntimeError):
@@ -17,18 +19,52 @@ class UnsupportedChallengeTypeError(RuntimeError):
 
 
 class ChallengeKeeper:
-    def __init__(self, result_storage: IResultStorage, symbol_settings: SymbolReplacementSettings) -> None:
+    def __init__(
+        self,
+        result_storage: IResultStorage,
+        progress_storage: IProgressStorage,
+        symbol_settings: SymbolReplacementSettings,
+        verdict_cache_size: int,
+    ) -> None:
         self._result_storage = result_storage
+        self._progress_storage = progress_storage
         self._symbol_settings = symbol_settings
+        self._verdict_cache: LRUCache[VerdictKey, bool] = LRUCache(maxsize=verdict_cache_size)
 
         self._data: Optional[ContextChallenge] = None
         self._info: Optional[AnyChallengeInfo] = None
         self._checker: Optional[AnyResultChecker] = None
 
+        self._state: Optional[QuizState] = None
+        self._state_expires_at: Optional[datetime] = None
+
     def set(self, info: AnyChallengeInfo, data: ContextChallenge) -> None:
+        if self._data is None or self._data.id != data.id:
+            self._verdict_cache.clear()
         self._data = data
         self._info = info
 
+    def cache_state(self, state: QuizState, ttl: timedelta) -> None:
+        expires_at = get_now() + ttl
+        if state is QuizState.IN_PROGRESS and self.has_data:
+            expires_at = min(expires_at, self.data.created_at + self.data.duration)
+        self._state = state
+        self._state_expires_at = expires_at
+
+    @property
+    def cached_state(self) -> Optional[QuizState]:
+        if self._state_expires_at is None or self._state_expires_at <= get_now():
+            return None
+        return self._state
+
+    def invalidate(self) -> None:
+        self._state = None
+        self._state_expires_at = None
+
+    @property
+    def verdict_cache(self) -> LRUCache[VerdictKey, bool]:
+        return self._verdict_cache
+
     @property
     def has_data(self) -> bool:
         return all((self._info is not None, self._data is not None))
@@ -74,7 +110,12 @@ class ChallengeKeeper:
     def checker(self) -> AnyResultChecker:
         checker_cls = self._get_checker()
         if not isinstance(self._checker, checker_cls):
-            self._checker = checker_cls(result_storage=self._result_storage, symbol_settings=self._symbol_settings)
+            self._checker = checker_cls(
+                result_storage=self._result_storage,
+                progress_storage=self._progress_storage,
+                symbol_settings=self._symbol_settings,
+                verdict_cache=self._verdict_cache,
+            )
         if self._checker is None:
             raise RuntimeError("Should not be there, mr mypy")
         return self._checker
@@ -1,9 +1,11 @@
 import logging
+from typing import Optional
 
 import requests
 import telebot
+from quiz_bot import db
 from quiz_bot.clients import BotResponse, ShoutboxClient, ShoutboxPrewrittenDetectedError, ShoutboxRequest
-from quiz_bot.entity import ChallengeType, ContextUser, EvaluationStatus, InfoSettings, QuizState
+from quiz_bot.entity import AnswerEvaluation, ChallengeType, ContextUser, EvaluationStatus, InfoSettings, QuizState
 from quiz_bot.quiz.challenge import ChallengeMaster
 from quiz_bot.quiz.errors import UnexpectedQuizStateError, UnreachableMessageProcessingError
 from quiz_bot.quiz.markup import UserMarkupMaker
@@ -14,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 
 class QuizManager:
+    """ Storage work of every response is made in one unit of work, requests to shoutbox are made after it. """
+
     def __init__(
         self,
         settings: InfoSettings,
@@ -65,6 +69,7 @@ class QuizManager:
             markup = self._markup_maker.help_markup
         return BotResponse(user=user, user_message=message.text, replies=replies, markup=markup,)
 
+    @db.unit_of_work()
     def get_help_response(self, message: telebot.types.Message) -> BotResponse:
         internal_user = self._user_storage.get_or_create_user(message)
         if self._state is QuizState.IN_PROGRESS:
@@ -83,6 +88,7 @@ class QuizManager:
             split=True,
         )
 
+    @db.unit_of_work()
     def get_start_response(self, message: telebot.types.Message) -> BotResponse:
         internal_user = self._user_storage.get_or_create_user(message)
         if self._state.prepared:
@@ -106,6 +112,7 @@ class QuizManager:
             picture=start_info.picture,
         )
 
+    @db.unit_of_work()
     def get_status_response(self, message: telebot.types.Message) -> BotResponse:
         internal_user = self._user_storage.get_or_create_user(message)
         if self._state.prepared:
@@ -131,6 +138,7 @@ class QuizManager:
             split=True,
         )
 
+    @db.unit_of_work()
     def get_skip_response(self, message: telebot.types.Message) -> BotResponse:
         internal_user = self._user_storage.get_or_create_user(message)
         if self._attempts_storage.ensure_skip_for_user(internal_user.id):
@@ -153,10 +161,11 @@ class QuizManager:
                 )
         return BotResponse(user=internal_user, user_message=message.text, reply=self._settings.skip_question_prohibited)
 
-    def _evaluate(self, user: ContextUser, message: telebot.types.Message) -> BotResponse:  # noqa: C901
-        evaluation = self._challenge_master.evaluate(user=user, message=message)
+    def _get_evaluation_response(  # noqa: C901
+        self, user: ContextUser, message: telebot.types.Message, evaluation: AnswerEvaluation
+    ) -> BotResponse:
         self._state = evaluation.quiz_state
-        replies = evaluation.replies
+        replies = list(evaluation.replies)
 
         if evaluation.status is EvaluationStatus.CORRECT:
             self._attempts_storage.clear(user.id)
@@ -203,10 +212,14 @@ class QuizManager:
         raise UnreachableMessageProcessingError("Should not be there!")
 
     def respond(self, message: telebot.types.Message) -> BotResponse:
-        internal_user = self._user_storage.get_or_create_user(message)
+        with db.unit_of_work():
+            internal_user = self._user_storage.get_or_create_user(message)
+            evaluation: Optional[AnswerEvaluation] = None
+            if internal_user is not None and self._state is not QuizState.NEW:
+                evaluation = self._challenge_master.evaluate(user=internal_user, message=message)
         if internal_user is None:
             logger.warning("Gotten message '%s' from unknown user: %s!", message.text, message.from_user)
             return self._get_simple_response(message, attach_unknown_info=True)
-        if self._state is QuizState.NEW:
+        if evaluation is None:
             return self._get_simple_response(message)
-        return self._evaluate(user=internal_user, message=message)
+        return self._get_evaluation_response(user=internal_user, message=message, evaluation=evaluation)
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Iterator, List, Optional
 
-from quiz_bot.clients import BotResponse, RemoteBotClient, SendMessageError
+import telebot
+from quiz_bot.clients import BotResponse, BroadcastReport, Broadcaster, ProgressCallback
 from quiz_bot.entity import InfoSettings
 from quiz_bot.quiz import UserMarkupMaker
 from quiz_bot.quiz.challenge import ChallengeMaster
@@ -11,29 +12,34 @@ class QuizNotifier:
     def __init__(
         self,
         user_storage: IUserStorage,
-        remote_client: RemoteBotClient,
+        broadcaster: Broadcaster,
         settings: InfoSettings,
         markup_maker: UserMarkupMaker,
         challenge_master: ChallengeMaster,
     ) -> None:
         self._user_storage = user_storage
-        self._remote_client = remote_client
+        self._broadcaster = broadcaster
         self._settings = settings
         self._markup_maker = markup_maker
         self._challenge_master = challenge_master
 
-    def notify(self, challenge_id: Optional[int], is_start: bool = False) -> None:
+    def notify(
+        self, challenge_id: Optional[int], is_start: bool = False, progress_callback: Optional[ProgressCallback] = None
+    ) -> BroadcastReport:
         challenge_info = self._challenge_master.get_challenge_info(challenge_id)
 
         replies = [challenge_info]
-        markup = None
+        markup: Optional[telebot.types.InlineKeyboardMarkup] = None
         if is_start:
             replies.append(self._settings.wait_for_user_info)
             markup = self._markup_maker.start_markup
 
+        return self._broadcaster.broadcast(
+            self._get_responses(replies=replies, markup=markup), progress_callback=progress_callback
+        )
+
+    def _get_responses(
+        self, replies: List[str], markup: Optional[telebot.types.InlineKeyboardMarkup]
+    ) -> Iterator[BotResponse]:
         for user in self._user_storage.users:
-            response = BotResponse(user=user, replies=replies, markup=markup)
-            try:
-                self._remote_client.send(response)
-            except SendMessageError:
-                pass
+            yield BotResponse(user=user, replies=replies, markup=markup)
@@ -21,4 +21,9 @@ class ContentType(str, enum.Enum):
     TEXT = 'text'
 
 
+class RuntimeMode(str, enum.Enum):
+    THREADED = 'threaded'
+    ASYNC = 'async'
+
+
 ChatEmptyReply = "Skip"
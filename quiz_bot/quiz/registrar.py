@@ -1,29 +1,38 @@
 from typing import List, Optional, Sequence
 
 from quiz_bot.entity import ContextChallenge, ContextParticipant, ContextUser, WinnerResult
-from quiz_bot.storage import IParticipantStorage
+from quiz_bot.storage import IParticipantStorage, IProgressStorage
 from quiz_bot.utils import get_now
 
 
 class Registrar:
-    def __init__(self, storage: IParticipantStorage):
+    def __init__(self, storage: IParticipantStorage, progress_storage: IProgressStorage):
         self._storage = storage
+        self._progress_storage = progress_storage
 
     def get_participation_for_user(
         self, user: ContextUser, challenge: ContextChallenge
     ) -> Optional[ContextParticipant]:
-        return self._storage.get_participation(user_id=user.id, challenge_id=challenge.id)
+        participant = self._progress_storage.get_participant(user_id=user.id, challenge_id=challenge.id)
+        if participant is not None:
+            return participant
+        snapshot = self._storage.get_snapshot(user_id=user.id, challenge_id=challenge.id)
+        if snapshot is None:
+            return None
+        self._progress_storage.save_participant(snapshot.participant)
+        if snapshot.result is not None:
+            self._progress_storage.save_result(snapshot.result)
+        return snapshot.participant
 
     def create_participation_for_user(self, user: ContextUser, challenge: ContextChallenge) -> ContextParticipant:
-        return self._storage.create_participant(user_id=user.id, challenge_id=challenge.id)
-
-    def add_correct_answer(self, participant: ContextParticipant) -> None:
-        self._storage.increment_score(participant_id=participant.id)
-        participant.scores += 1
+        participant = self._storage.create_participant(user=user, challenge=challenge)
+        self._progress_storage.save_participant(participant)
+        return participant
 
     def finish_participation(self, participant: ContextParticipant) -> None:
         participant.finished_at = get_now()
         self._storage.finish_participation(participant_id=participant.id, finished_at=participant.finished_at)
+        self._progress_storage.save_participant(participant)
 
     def all_winners_exist(self, challenge: ContextChallenge) -> bool:
         return self._storage.has_all_winners(challenge_id=challenge.id, winner_amount=challenge.winner_amount)
@@ -1,8 +1,9 @@
 # flake8: noqa
 from .attempts import AttemptsStorage, IAttemptsStorage
 from .challenge import ChallengeStorage, IChallengeStorage
-from .errors import NoResultFoundError
-from .message import IMessageStorage, MessageStorage
+from .errors import NoResultFoundError, PhaseAlreadyFinishedError
+from .message import BufferedMessageStorage, IMessageStorage, MessageStorage
 from .participant import IParticipantStorage, ParticipantStorage
+from .progress import IProgressStorage, ProgressStorage
 from .result import IResultStorage, ResultStorage
 from .user import IUserStorage, UserStorage
@@ -1,9 +1,8 @@
 import abc
 import datetime
 import logging
-from typing import Optional, Sequence, Tuple, cast
+from typing import Optional, Sequence, cast
 
-import sqlalchemy.orm as so
 from quiz_bot import db
 from quiz_bot.entity import ContextChallenge
 from quiz_bot.storage.errors import NoActualChallengeError
@@ -37,10 +36,6 @@ class IChallengeStorage(abc.ABC):
     def get_finished_challenge_ids(self) -> Sequence[int]:
         pass
 
-    @abc.abstractmethod
-    def get_challenge_ids(self, session: so.Session) -> Sequence[int]:
-        pass
-
 
 class ChallengeStorage(IChallengeStorage):
     def create_challenge(
@@ -81,9 +76,3 @@ class ChallengeStorage(IChallengeStorage):
     def get_finished_challenge_ids(self) -> Sequence[int]:
         with db.create_session() as session:
             return cast(Sequence[int], session.query(db.Challenge).get_finished_ids())
-
-    def get_challenge_ids(self, session: so.Session) -> Sequence[int]:
-        ids: Sequence[Tuple[int]] = session.query(db.Challenge).with_entities(db.Challenge.id).order_by(
-            db.Challenge.id.asc()
-        ).all()
-        return [x[0] for x in ids]
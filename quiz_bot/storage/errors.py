@@ -12,3 +12,7 @@ class NoResultFoundError(RuntimeError):
 
 class NoParticipantFoundError(RuntimeError):
     pass
+
+
+class PhaseAlreadyFinishedError(RuntimeError):
+    pass
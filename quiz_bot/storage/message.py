@@ -1,12 +1,21 @@
 import abc
+import collections
 import logging
-from typing import List, Sequence
+import threading
+from typing import Counter, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, cast
 
+import sqlalchemy as sa
+import sqlalchemy.orm as so
 from quiz_bot import db
-from quiz_bot.entity import ContextMessage, MessageCloudSettings
+from quiz_bot.entity import BufferOverflowPolicy, ContextMessage, MessageBufferSettings, MessageCloudSettings
+from quiz_bot.utils import count_words, get_now
+from sqlalchemy.dialects import postgresql
 
 logger = logging.getLogger(__name__)
 
+# `xmax` of row version is zero only when the row has been inserted, not updated on conflict
+_IS_INSERTED = sa.literal_column('xmax = 0').label('inserted')
+
 
 class IMessageStorage(abc.ABC):
     @abc.abstractmethod
@@ -19,32 +28,213 @@ class IMessageStorage(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def messages(self) -> Sequence[ContextMessage]:
+    def messages(self) -> Iterable[ContextMessage]:
+        pass
+
+    @property
+    @abc.abstractmethod
+    def word_frequencies(self) -> Dict[str, int]:
+        pass
+
+    @property
+    @abc.abstractmethod
+    def recent_word_frequencies(self) -> Dict[str, int]:
         pass
 
 
 class MessageStorage(IMessageStorage):
     def __init__(self, settings: MessageCloudSettings) -> None:
         self._settings = settings
+        self._words_lock = threading.Lock()
+        self._words_amount: Optional[int] = None
 
     def save(self, text: str) -> None:
-        with db.create_session() as session:
-            session.add(db.Message(text))
+        self.save_all([text])
 
     def save_all(self, texts: Sequence[str]) -> None:
+        if not texts:
+            return
+        with db.create_session() as session:
+            session.execute(db.Message.__table__.insert().values([{'text': text} for text in texts]))
+            self._add_word_frequencies(session, self._count_words(texts))
+
+    def _count_words(self, texts: Iterable[str]) -> Counter[str]:
+        return count_words(texts, stopwords=self._settings.stopwords, min_length=self._settings.min_word_length)
+
+    @staticmethod
+    def _get_words_amount(session: so.Session) -> int:
+        table = db.WordFrequency.__table__
+        return int(session.execute(sa.select([sa.func.count()]).select_from(table)).scalar())
+
+    def _add_word_frequencies(self, session: so.Session, counter: Counter[str]) -> None:
+        """ Add counted words to frequency table. When it grows twice over `words_retention`,
+        only `words_retention` most frequent words are kept. Size of the table is counted once and then
+        is tracked by inserted rows, so it is an estimation, which is corrected by pruning. """
+        if not counter:
+            return
+        table = db.WordFrequency.__table__
+        statement = postgresql.insert(table).values(
+            [{'word': word, 'frequency': frequency} for word, frequency in sorted(counter.items())]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.word], set_={'frequency': table.c.frequency + statement.excluded.frequency}
+        ).returning(_IS_INSERTED)
+        with self._words_lock:
+            if self._words_amount is None:
+                self._words_amount = self._get_words_amount(session)
+            self._words_amount += sum(1 for row in session.execute(statement) if row.inserted)
+            if self._words_amount <= 2 * self._settings.words_retention:
+                return
+            rare_words = (
+                sa.select([table.c.word])
+                .order_by(table.c.frequency.desc(), table.c.word)
+                .offset(self._settings.words_retention)
+            )
+            session.execute(table.delete().where(table.c.word.in_(rare_words)))
+            self._words_amount = self._get_words_amount(session)
+
+    def rebuild_word_frequencies(self) -> int:
+        """ Count words of all saved messages again, returns amount of distinct words. """
+        counter: Counter[str] = collections.Counter()
         with db.create_session() as session:
-            for text in texts:
-                session.add(db.Message(text))
+            rows = session.query(db.Message.text).yield_per(self._settings.stream_batch_size)
+            counter.update(self._count_words(row.text for row in rows))
+            session.execute(db.WordFrequency.__table__.delete())
+            self._words_amount = None
+            top_words = collections.Counter(dict(counter.most_common(self._settings.words_retention)))
+            self._add_word_frequencies(session, top_words)
+        return len(counter)
+
+    def _get_query(self, session: so.Session) -> so.Query:
+        since = None
+        if self._settings.select_window is not None:
+            since = get_now() - self._settings.select_window
+        return session.query(db.Message).get_recent(limit=self._settings.select_limit, since=since)
 
     @property
-    def messages(self) -> Sequence[ContextMessage]:
+    def messages(self) -> Iterable[ContextMessage]:
+        """ Newest messages in one query, or lazily through server-side cursor in streaming mode. """
+        if self._settings.stream:
+            return self._stream_messages()
         with db.create_session() as session:
-            message_ids = session.query(db.Message).get_message_ids(limit=self._settings.select_limit)
-            messages: List[ContextMessage] = []
-            if message_ids:
-                for message_id in message_ids:
-                    db_message = session.query(db.Message).get(message_id)
-                    messages.append(ContextMessage.from_orm(db_message))
-            else:
-                logger.warning("No one message was found in database!")
+            messages = [ContextMessage.from_orm(x) for x in self._get_query(session)]
+        if not messages:
+            logger.warning("No one message was found in database!")
         return messages
+
+    def _stream_messages(self) -> Iterator[ContextMessage]:
+        with db.create_session() as session:
+            for row in self._get_query(session).yield_per(self._settings.stream_batch_size):
+                yield ContextMessage.from_orm(row)
+
+    @property
+    def word_frequencies(self) -> Dict[str, int]:
+        with db.create_session() as session:
+            return cast(Dict[str, int], session.query(db.WordFrequency).get_top(self._settings.max_words))
+
+    @property
+    def recent_word_frequencies(self) -> Dict[str, int]:
+        """ Frequencies of words of recent messages, counted on the fly. """
+        counter = self._count_words(x.text for x in self.messages)
+        return dict(counter.most_common(self._settings.max_words))
+
+
+class BufferedMessageStorage(IMessageStorage):
+    """ Write-behind wrapper: messages are collected in bounded buffer and saved by background thread in bulk. """
+
+    def __init__(self, storage: IMessageStorage, settings: MessageBufferSettings) -> None:
+        self._storage = storage
+        self._settings = settings
+        self._buffer: Deque[str] = collections.deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._work, name='message-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def save(self, text: str) -> None:
+        self.save_all([text])
+
+    def save_all(self, texts: Sequence[str]) -> None:
+        """ Buffer messages for background saving, after closing they are saved right away. """
+        unbuffered = self._buffer_all(texts)
+        if unbuffered:
+            self._storage.save_all(unbuffered)
+
+    def _buffer_all(self, texts: Sequence[str]) -> Sequence[str]:
+        """ Returns messages which could not be buffered because of closed buffer. """
+        with self._condition:
+            for num, text in enumerate(texts):
+                has_room = self._wait_for_room()
+                if self._closed:
+                    return texts[num:]
+                if not has_room:
+                    self._dropped += 1
+                    continue
+                self._buffer.append(text)
+            if len(self._buffer) >= self._settings.flush_size:
+                self._condition.notify_all()
+        return ()
+
+    def _has_room(self) -> bool:
+        max_size: int = self._settings.max_size
+        return len(self._buffer) < max_size
+
+    def _wait_for_room(self) -> bool:
+        if self._settings.overflow_policy is BufferOverflowPolicy.BLOCK:
+            self._condition.wait_for(lambda: self._has_room() or self._closed)
+        return self._has_room()
+
+    @property
+    def messages(self) -> Iterable[ContextMessage]:
+        return self._storage.messages
+
+    @property
+    def word_frequencies(self) -> Dict[str, int]:
+        return self._storage.word_frequencies
+
+    @property
+    def recent_word_frequencies(self) -> Dict[str, int]:
+        return self._storage.recent_word_frequencies
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._buffer) >= self._settings.flush_size or self._closed,
+                    timeout=self._settings.flush_interval,
+                )
+                batch: List[str] = [
+                    self._buffer.popleft() for _ in range(min(len(self._buffer), self._settings.flush_size))
+                ]
+                closed = self._closed
+                self._condition.notify_all()
+            if batch:
+                self._flush(batch)
+            elif closed:
+                return
+
+    def _flush(self, batch: List[str]) -> None:
+        try:
+            self._storage.save_all(batch)
+        except Exception:
+            logger.exception("Could not save %s messages, they are dropped!", len(batch))
+            with self._condition:
+                self._dropped += len(batch)
+
+    def close(self) -> None:
+        """ Save all buffered messages and stop background thread. """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        if self._dropped:
+            logger.warning("%s messages have been dropped by message buffer.", self._dropped)
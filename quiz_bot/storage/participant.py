@@ -5,23 +5,27 @@ from typing import Optional, Sequence, cast
 
 import sqlalchemy.orm as so
 from quiz_bot import db
-from quiz_bot.entity import ContextParticipant
+from quiz_bot.entity import (
+    ChallengeSummary,
+    ContextChallenge,
+    ContextParticipant,
+    ContextResult,
+    ContextUser,
+    PlayerSnapshot,
+)
 from quiz_bot.storage.errors import NoParticipantFoundError
+from sqlalchemy.dialects import postgresql
 
 logger = logging.getLogger(__name__)
 
 
 class IParticipantStorage(abc.ABC):
     @abc.abstractmethod
-    def create_participant(self, user_id: int, challenge_id: int) -> ContextParticipant:
+    def create_participant(self, user: ContextUser, challenge: ContextChallenge) -> ContextParticipant:
         pass
 
     @abc.abstractmethod
-    def get_participation(self, user_id: int, challenge_id: int) -> Optional[ContextParticipant]:
-        pass
-
-    @abc.abstractmethod
-    def increment_score(self, participant_id: int) -> None:
+    def get_snapshot(self, user_id: int, challenge_id: int) -> Optional[PlayerSnapshot]:
         pass
 
     @abc.abstractmethod
@@ -37,15 +41,7 @@ class IParticipantStorage(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_participants_amount(self, session: so.Session, challenge_id: int) -> int:
-        pass
-
-    @abc.abstractmethod
-    def get_pretenders_amount(self, session: so.Session, challenge_id: int) -> int:
-        pass
-
-    @abc.abstractmethod
-    def get_max_scores(self, session: so.Session, challenge_id: int) -> Optional[int]:
+    def get_challenge_summaries(self, session: so.Session) -> Sequence[ChallengeSummary]:
         pass
 
 
@@ -59,28 +55,37 @@ class ParticipantStorage(IParticipantStorage):
             )
         return cast(db.Participant, db_participant)
 
-    def create_participant(self, user_id: int, challenge_id: int) -> ContextParticipant:
+    def create_participant(self, user: ContextUser, challenge: ContextChallenge) -> ContextParticipant:
+        participants = db.Participant.__table__
+        statement = (
+            postgresql.insert(participants)
+            .values(user_id=user.id, challenge_id=challenge.id, scores=0)
+            .on_conflict_do_nothing(constraint='uq_participants_user_id_challenge_id')
+            .returning(*participants.columns)
+        )
         with db.create_session() as session:
-            session.add(db.Participant(user_id=user_id, challenge_id=challenge_id))
-            session.flush()
-            return cast(
-                ContextParticipant,
-                ContextParticipant.from_orm(
-                    self._get_existing_participant(session, user_id=user_id, challenge_id=challenge_id)
-                ),
-            )
-
-    def get_participation(self, user_id: int, challenge_id: int) -> Optional[ContextParticipant]:
+            row = session.execute(statement).first()
+            if row is None:
+                logger.warning("User ID %s is already a participant of challenge ID %s", user.id, challenge.id)
+                return cast(
+                    ContextParticipant,
+                    ContextParticipant.from_orm(
+                        self._get_existing_participant(session, user_id=user.id, challenge_id=challenge.id)
+                    ),
+                )
+        return ContextParticipant(user=user, challenge=challenge, **row)
+
+    def get_snapshot(self, user_id: int, challenge_id: int) -> Optional[PlayerSnapshot]:
         with db.create_session() as session:
-            participant = session.query(db.Participant).get_by_challenge(user_id=user_id, challenge_id=challenge_id)
-            if participant is not None:
-                return cast(ContextParticipant, ContextParticipant.from_orm(participant))
-            return None
-
-    def increment_score(self, participant_id: int) -> None:
-        with db.create_session() as session:
-            db_participant = session.query(db.Participant).get(participant_id)
-            db_participant.scores += 1
+            participant = session.query(db.Participant).get_snapshot(user_id=user_id, challenge_id=challenge_id)
+            if participant is None:
+                return None
+            return PlayerSnapshot(
+                participant=ContextParticipant.from_orm(participant),
+                result=ContextResult.from_orm(participant.current_result)
+                if participant.current_result is not None
+                else None,
+            )
 
     def finish_participation(self, participant_id: int, finished_at: datetime.datetime) -> None:
         with db.create_session() as session:
@@ -99,14 +104,13 @@ class ParticipantStorage(IParticipantStorage):
             )
             return len(db_pretenders) == winner_amount
 
-    def get_participants_amount(self, session: so.Session, challenge_id: int) -> int:
-        return cast(int, session.query(db.Participant).get_participant_amount(challenge_id=challenge_id))
-
-    def get_pretenders_amount(self, session: so.Session, challenge_id: int) -> int:
-        return cast(int, session.query(db.Participant).get_pretenders_amount(challenge_id=challenge_id))
-
-    def get_max_scores(self, session: so.Session, challenge_id: int) -> Optional[int]:
-        participant = session.query(db.Participant).get_max_scores(challenge_id=challenge_id)
-        if participant is not None:
-            return cast(int, participant.scores)
-        return None
+    def get_challenge_summaries(self, session: so.Session) -> Sequence[ChallengeSummary]:
+        return [
+            ChallengeSummary(
+                challenge=ContextChallenge.from_orm(row),
+                participants=row.participants,
+                pretenders=row.pretenders,
+                max_scores=row.max_scores,
+            )
+            for row in session.query(db.Participant).get_challenge_summaries()
+        ]
@@ -0,0 +1,70 @@
+import abc
+import threading
+from typing import Dict, Optional
+
+from quiz_bot import db
+from quiz_bot.entity import ContextParticipant, ContextResult
+
+
+class IProgressStorage(abc.ABC):
+    @abc.abstractmethod
+    def get_participant(self, user_id: int, challenge_id: int) -> Optional[ContextParticipant]:
+        pass
+
+    @abc.abstractmethod
+    def save_participant(self, participant: ContextParticipant) -> None:
+        pass
+
+    @abc.abstractmethod
+    def get_result(self, participant_id: int) -> Optional[ContextResult]:
+        pass
+
+    @abc.abstractmethod
+    def save_result(self, result: ContextResult) -> None:
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class ProgressStorage(IProgressStorage):
+    """ In-process write-through cache of participants progress for the actual challenge. """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._challenge_id: Optional[int] = None
+        self._participants: Dict[int, ContextParticipant] = {}
+        self._results: Dict[int, ContextResult] = {}
+        db.add_rollback_listener(self.clear)
+
+    def _switch_challenge(self, challenge_id: int) -> None:
+        if self._challenge_id != challenge_id:
+            self._challenge_id = challenge_id
+            self._participants = {}
+            self._results = {}
+
+    def get_participant(self, user_id: int, challenge_id: int) -> Optional[ContextParticipant]:
+        with self._lock:
+            if self._challenge_id != challenge_id:
+                return None
+            return self._participants.get(user_id)
+
+    def save_participant(self, participant: ContextParticipant) -> None:
+        with self._lock:
+            self._switch_challenge(participant.challenge_id)
+            self._participants[participant.user_id] = participant
+
+    def get_result(self, participant_id: int) -> Optional[ContextResult]:
+        with self._lock:
+            return self._results.get(participant_id)
+
+    def save_result(self, result: ContextResult) -> None:
+        with self._lock:
+            self._results[result.participant_id] = result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._challenge_id = None
+            self._participants = {}
+            self._results = {}
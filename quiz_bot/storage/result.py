@@ -1,11 +1,14 @@
 import abc
 import logging
 from datetime import datetime
-from typing import cast
+from typing import Any, Dict, Optional, Tuple, cast
 
+import sqlalchemy as sa
+import sqlalchemy.orm as so
 from quiz_bot import db
 from quiz_bot.entity import ContextResult
-from quiz_bot.storage.errors import NoResultFoundError
+from quiz_bot.storage.errors import NoResultFoundError, PhaseAlreadyFinishedError
+from sqlalchemy.dialects import postgresql
 
 logger = logging.getLogger(__name__)
 
@@ -16,30 +19,76 @@ class IResultStorage(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def finish_phase(self, result: ContextResult, finish_time: datetime) -> None:
+    def advance_phase(
+        self, result: ContextResult, finish_time: datetime, next_phase: Optional[int], score_increment: int
+    ) -> Tuple[int, Optional[ContextResult]]:
         pass
 
     @abc.abstractmethod
-    def get_last_result(self, participant_id: int) -> ContextResult:
+    def get_current_result(self, participant_id: int) -> ContextResult:
         pass
 
 
 class ResultStorage(IResultStorage):
+    @staticmethod
+    def _update_participant(session: so.Session, participant_id: int, **values: Any) -> Optional[int]:
+        return cast(
+            Optional[int],
+            session.execute(
+                sa.update(db.Participant.__table__)
+                .where(db.Participant.id == participant_id)
+                .values(**values)
+                .returning(db.Participant.scores)
+            ).scalar(),
+        )
+
     def create_result(self, participant_id: int, phase: int) -> ContextResult:
+        results = db.Result.__table__
+        statement = (
+            postgresql.insert(results)
+            .values(participant_id=participant_id, phase=phase)
+            .on_conflict_do_nothing(constraint='uq_results_participant_id_phase')
+            .returning(*results.columns)
+        )
         with db.create_session() as session:
-            db_result = db.Result(participant_id=participant_id, phase=phase)
-            session.add(db_result)
-            session.flush()
-            return cast(ContextResult, ContextResult.from_orm(db_result))
+            row = session.execute(statement).first()
+            if row is None:
+                row = session.query(db.Result).filter_by(participant_id=participant_id, phase=phase).one()
+            self._update_participant(session, participant_id, current_phase=phase, current_result_id=row.id)
+            return cast(ContextResult, ContextResult.from_orm(row))
 
-    def finish_phase(self, result: ContextResult, finish_time: datetime) -> None:
+    def advance_phase(
+        self, result: ContextResult, finish_time: datetime, next_phase: Optional[int], score_increment: int
+    ) -> Tuple[int, Optional[ContextResult]]:
+        """ Finish current phase, start the next one and add scores in one transaction.
+        Returns actual participant scores and the next phase result, if any.
+        Raises PhaseAlreadyFinishedError when the result has been finished by another answer. """
         with db.create_session() as session:
-            db_result = session.query(db.Result).get(result.id)
-            db_result.finished_at = finish_time
+            session.flush()
+            finished = session.execute(
+                sa.update(db.Result.__table__)
+                .where(sa.and_(db.Result.id == result.id, db.Result.finished_at.is_(None)))
+                .values(finished_at=finish_time)
+            )
+            if finished.rowcount != 1:
+                raise PhaseAlreadyFinishedError(f"Result with ID {result.id} has already been finished!")
+            values: Dict[str, Any] = {'scores': db.Participant.scores + score_increment}
+            next_result: Optional[ContextResult] = None
+            if next_phase is not None:
+                row = session.execute(
+                    sa.insert(db.Result.__table__)
+                    .values(participant_id=result.participant_id, phase=next_phase)
+                    .returning(*db.Result.__table__.columns)
+                ).first()
+                next_result = cast(ContextResult, ContextResult.from_orm(row))
+                values.update(current_phase=next_phase, current_result_id=next_result.id)
+            scores = self._update_participant(session, result.participant_id, **values)
+            session.expire_all()
+            return cast(int, scores), next_result
 
-    def get_last_result(self, participant_id: int) -> ContextResult:
+    def get_current_result(self, participant_id: int) -> ContextResult:
         with db.create_session() as session:
-            result = session.query(db.Result).last_for_participant(participant_id=participant_id)
+            result = session.query(db.Result).get_current(participant_id=participant_id)
             if result is None:
                 raise NoResultFoundError(f"Not found any Result for Participant with ID {participant_id}")
             return cast(ContextResult, ContextResult.from_orm(result))
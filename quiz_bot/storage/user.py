@@ -3,10 +3,13 @@ import logging
 from typing import Iterator, Optional, cast
 from uuid import uuid4
 
+import sqlalchemy as sa
 import sqlalchemy.orm as so
 import telebot
 from quiz_bot import db
-from quiz_bot.entity import ContextUser
+from quiz_bot.entity import ContextUser, UserStorageSettings
+from quiz_bot.utils import LRUCache
+from sqlalchemy.dialects import postgresql
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +43,15 @@ class IUserStorage(abc.ABC):
 
 
 class UserStorage(IUserStorage):
+    def __init__(self, settings: UserStorageSettings) -> None:
+        self._settings = settings
+        self._identity_cache: LRUCache[int, ContextUser] = LRUCache(maxsize=settings.cache_size, ttl=settings.cache_ttl)
+        db.add_rollback_listener(self._identity_cache.clear)
+
+    @property
+    def identity_cache(self) -> LRUCache[int, ContextUser]:
+        return self._identity_cache
+
     def get_user(self, user: telebot.types.User) -> Optional[ContextUser]:
         with db.create_session() as session:
             internal_user = session.query(db.User).get_by_external_id(user.id)
@@ -57,29 +69,36 @@ class UserStorage(IUserStorage):
     def get_or_create_user(self, message: telebot.types.Message) -> ContextUser:
         remote_user = message.from_user
         remote_chat_id = message.chat.id
+        context_user = self._identity_cache.get(remote_user.id)
+        if context_user is None or context_user.remote_chat_id != remote_chat_id:
+            context_user = self._load_or_save_user(remote_user, remote_chat_id)
+            self._identity_cache.set(remote_user.id, context_user)
+        return context_user
+
+    def _load_or_save_user(self, remote_user: telebot.types.User, remote_chat_id: int) -> ContextUser:
+        """ Existing users are only selected, upsert is made for new users and changed chats. """
         with db.create_session() as session:
-            internal_user = session.query(db.User).get_by_external_id(value=remote_user.id)
-            if internal_user is not None:
-                logger.debug("User %s exists", internal_user)
-                if internal_user.remote_chat_id != remote_chat_id:
-                    internal_user.remote_chat_id = remote_chat_id
+            internal_user = session.query(db.User).get_by_external_id(remote_user.id)
+            if internal_user is not None and internal_user.remote_chat_id == remote_chat_id:
                 return cast(ContextUser, ContextUser.from_orm(internal_user))
 
-            logger.info("User with external_id %s not found, try to save...", remote_user.id)
-            internal_user = db.User(
-                external_id=remote_user.id,
-                remote_chat_id=remote_chat_id,
-                chitchat_id=str(uuid4()),
-                first_name=remote_user.first_name,
-                last_name=remote_user.last_name,
-                nick_name=remote_user.username,
-            )
-            session.add(internal_user)
-        logger.info("User %s successfully saved.", remote_user)
-        context_user = self.get_user(remote_user)
-        if internal_user is not None:
-            return cast(ContextUser, context_user)
-        raise RuntimeError("User has not been saved into database!")
+        users = db.User.__table__
+        statement = postgresql.insert(users).values(
+            external_id=remote_user.id,
+            remote_chat_id=remote_chat_id,
+            chitchat_id=str(uuid4()),
+            first_name=remote_user.first_name,
+            last_name=remote_user.last_name,
+            nick_name=remote_user.username,
+        )
+        statement = statement.on_conflict_do_update(
+            constraint='uq_users_external_id', set_={'remote_chat_id': statement.excluded.remote_chat_id}
+        ).returning(*users.columns, sa.literal_column('xmax = 0').label('inserted'))
+        with db.create_session() as session:
+            row = session.execute(statement).first()
+        if row.inserted:
+            logger.info("User %s successfully saved.", remote_user)
+        return cast(ContextUser, ContextUser.from_orm(row))
 
     @staticmethod
     def make_unknown_context_user(message: telebot.types.Message) -> ContextUser:
@@ -93,16 +112,17 @@ class UserStorage(IUserStorage):
 
     @property
     def users(self) -> Iterator[ContextUser]:
-        with db.create_session() as session:
-            user_ids = session.query(db.User).get_all_user_ids()
-        if not user_ids:
-            logger.warning("No one user was found in database!")
-            return
-        for user_id in user_ids:
+        last_id = 0
+        while True:
             with db.create_session() as session:
-                db_user = session.query(db.User).get(user_id)
-                context_user = ContextUser.from_orm(db_user)
-            yield context_user
+                rows = session.query(db.User).get_batch_after(last_id, limit=self._settings.batch_size)
+                batch = [ContextUser.from_orm(x) for x in rows]
+            if not batch:
+                break
+            yield from batch
+            last_id = batch[-1].id
+        if not last_id:
+            logger.warning("No one user was found in database!")
 
     def get_user_ids_amount(self, session: so.Session) -> int:
         return cast(int, session.query(db.User).with_entities(db.User.id).count())
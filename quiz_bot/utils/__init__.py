@@ -1,2 +1,6 @@
 # flake8: noqa
 from .time import display_time, get_now
+from .cache import CacheMetrics, LRUCache
+from .metrics import MetricsReporter
+from .rate_limit import TokenBucket
+from .words import count_words
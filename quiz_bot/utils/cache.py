@@ -0,0 +1,67 @@
+import collections
+import threading
+import time
+from dataclasses import dataclass
+from typing import Generic, Hashable, Optional, OrderedDict, Tuple, TypeVar
+
+TKey = TypeVar('TKey', bound=Hashable)
+TValue = TypeVar('TValue')
+
+
+@dataclass(frozen=True)
+class CacheMetrics:
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class LRUCache(Generic[TKey, TValue]):
+    """ Thread-safe bounded cache with least-recently-used eviction and optional TTL for entries. """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._data: OrderedDict[TKey, Tuple[float, TValue]] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: TKey) -> Optional[TValue]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or (self._ttl is not None and item[0] + self._ttl < time.monotonic()):
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: TKey, value: TValue) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: TKey) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        total = self.hits + self.misses
+        return CacheMetrics(
+            size=len(self._data), hits=self.hits, misses=self.misses, hit_rate=self.hits / total if total else 0.0
+        )
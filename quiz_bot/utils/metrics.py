@@ -0,0 +1,38 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MetricsSource = Callable[[], Any]
+
+
+class MetricsReporter:
+    """ Logs metrics of registered sources periodically from background thread. """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._sources: Dict[str, MetricsSource] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, source: MetricsSource) -> None:
+        self._sources[name] = source
+
+    def report(self) -> None:
+        for name, source in list(self._sources.items()):
+            logger.info("Metrics of %s: %s", name, source())
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._work, name='metrics-reporter', daemon=True)
+        self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            try:
+                self.report()
+            except Exception:
+                logger.exception("Could not report metrics!")
@@ -0,0 +1,24 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """ Thread-safe token bucket: every reservation takes one token and returns delay before it could be used. """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self._interval = 1 / rate
+        self._tolerance = (capacity - 1) * self._interval
+        self._lock = threading.Lock()
+        self._arrival_at = 0.0
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            arrival_at = max(self._arrival_at, now)
+            self._arrival_at = arrival_at + self._interval
+            return max(0.0, arrival_at - self._tolerance - now)
+
+    def pause(self, seconds: float) -> None:
+        """ Forbid reservations to be used earlier than after specified seconds. """
+        with self._lock:
+            self._arrival_at = max(self._arrival_at, time.monotonic() + seconds + self._tolerance)
@@ -0,0 +1,18 @@
+import collections
+import re
+from typing import AbstractSet, Counter, Iterable
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['-][^\W\d_]+)*")
+_MAX_WORD_LENGTH = 64
+
+
+def count_words(texts: Iterable[str], stopwords: AbstractSet[str], min_length: int) -> Counter[str]:
+    """ Count words of texts without HTML markup, numbers, stop words and too short words. """
+    counter: Counter[str] = collections.Counter()
+    for text in texts:
+        for word in _WORD_PATTERN.findall(_TAG_PATTERN.sub(" ", text)):
+            word = word.casefold()
+            if min_length <= len(word) <= _MAX_WORD_LENGTH and word not in stopwords:
+                counter[word] += 1
+    return counter
@@ -0,0 +1,49 @@
+import time
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+
+
+class FakeBotApi:
+    """ Bot API server for tests: records sent messages and answers with `429 Too Many Requests` when asked. """
+
+    def __init__(self, flood_calls: int = 0, retry_after: int = 1) -> None:
+        self.messages: List[Tuple[float, int, str]] = []
+        self.flood_calls = flood_calls
+        self.retry_after = retry_after
+        self._runner = web.AppRunner(self._make_app())
+        self.url = ''
+
+    def _make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/bot{token}/{method}', self._handle)
+        return app
+
+    async def start(self) -> None:
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f'http://{host}:{port}'
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info['method']
+        payload: Dict[str, Any] = await request.json() if request.content_type == 'application/json' else {}
+        if method != 'sendMessage':
+            return web.json_response({'ok': True, 'result': True})
+        if self.flood_calls > 0:
+            self.flood_calls -= 1
+            return web.json_response(
+                {
+                    'ok': False,
+                    'error_code': 429,
+                    'description': f'Too Many Requests: retry after {self.retry_after}',
+                    'parameters': {'retry_after': self.retry_after},
+                },
+                status=429,
+            )
+        self.messages.append((time.monotonic(), payload['chat_id'], payload['text']))
+        return web.json_response({'ok': True, 'result': {'message_id': len(self.messages), 'date': 0}})
@@ -0,0 +1,38 @@
+import json
+from typing import Any, Dict, Optional
+
+import requests
+from quiz_bot.clients.webhook import SECRET_TOKEN_HEADER
+
+
+def make_message_update(update_id: int, chat_id: int, text: str) -> Dict[str, Any]:
+    return {
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'date': 0,
+            'text': text,
+            'chat': {'id': chat_id, 'type': 'private'},
+            'from': {'id': chat_id, 'is_bot': False, 'first_name': 'User'},
+        },
+    }
+
+
+class WebhookReplayClient:
+    """ Replays updates to webhook endpoint the same way as Bot API does. """
+
+    def __init__(self, url: str, secret: Optional[str]) -> None:
+        self._url = url
+        self._secret = secret
+        self._update_id = 0
+
+    def make_message_update(self, chat_id: int, text: str) -> Dict[str, Any]:
+        self._update_id += 1
+        return make_message_update(self._update_id, chat_id=chat_id, text=text)
+
+    def replay(self, update: Dict[str, Any], path: str = '') -> int:
+        headers = {'Content-Type': 'application/json'}
+        if self._secret is not None:
+            headers[SECRET_TOKEN_HEADER] = self._secret
+        response = requests.post(self._url + path, data=json.dumps(update), headers=headers, timeout=5)
+        return response.status_code
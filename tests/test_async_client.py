@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List, Tuple
+
+import pytest
+from quiz_bot.clients import BotResponse, SendMessageError
+from quiz_bot.clients.telegram_async import AsyncRemoteBotClient
+from quiz_bot.entity import ContextUser, RemoteClientSettings
+from tests.fake_bot_api import FakeBotApi
+
+ClientCase = Callable[[AsyncRemoteBotClient, FakeBotApi], Awaitable[None]]
+
+
+def _run(case: ClientCase, api: FakeBotApi, **settings: Any) -> None:
+    async def run() -> None:
+        await api.start()
+        try:
+            async with AsyncRemoteBotClient(RemoteClientSettings(token='token', api_url=api.url, **settings)) as client:
+                await case(client, api)
+        finally:
+            await api.stop()
+
+    asyncio.run(run())
+
+
+def _make_response(chat_id: int, text: str) -> BotResponse:
+    user = ContextUser(id=chat_id, external_id=chat_id, remote_chat_id=chat_id, chitchat_id=str(chat_id))
+    return BotResponse(user=user, reply=text)
+
+
+def _get_texts(messages: List[Tuple[float, int, str]], chat_id: int) -> List[str]:
+    return [text for _, chat, text in messages if chat == chat_id]
+
+
+def test_replies_keep_chat_order() -> None:
+    async def case(client: AsyncRemoteBotClient, api: FakeBotApi) -> None:
+        responses = [_make_response(chat_id, str(num)) for num in range(5) for chat_id in (1, 2)]
+        await asyncio.gather(*(client.send(x) for x in responses))
+        assert _get_texts(api.messages, 1) == ['0', '1', '2', '3', '4']
+        assert _get_texts(api.messages, 2) == ['0', '1', '2', '3', '4']
+        assert client.send_metrics.sent == 10
+        assert client.send_metrics.queue_depth == client.send_metrics.in_flight == 0
+
+    _run(case, FakeBotApi(), send_rate_limit=1000, chat_send_rate_limit=1000, chat_send_burst=10)
+
+
+def test_chat_rate_is_limited() -> None:
+    async def case(client: AsyncRemoteBotClient, api: FakeBotApi) -> None:
+        await asyncio.gather(*(client.send(_make_response(1, str(num))) for num in range(4)))
+        times = [sent_at for sent_at, _, _ in api.messages]
+        assert times[-1] - times[0] >= 0.2
+
+    _run(case, FakeBotApi(), send_rate_limit=1000, chat_send_rate_limit=10, chat_send_burst=1)
+
+
+def test_flood_waits_for_retry_after() -> None:
+    async def case(client: AsyncRemoteBotClient, api: FakeBotApi) -> None:
+        started_at = time.monotonic()
+        await client.send(_make_response(1, 'reply'))
+        assert time.monotonic() - started_at >= api.retry_after
+        assert _get_texts(api.messages, 1) == ['reply']
+        assert client.send_metrics.throttled == 1
+
+    _run(case, FakeBotApi(flood_calls=1))
+
+
+@pytest.mark.parametrize('attempts', [1, 2])
+def test_flood_fails_after_attempts(attempts: int) -> None:
+    async def case(client: AsyncRemoteBotClient, api: FakeBotApi) -> None:
+        with pytest.raises(SendMessageError):
+            await client.send(_make_response(1, 'reply'))
+        assert not api.messages
+        assert client.send_metrics.failed == 1
+
+    _run(case, FakeBotApi(flood_calls=attempts, retry_after=0), send_attempts=attempts)
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+from typing import List, cast
+
+import telebot
+from quiz_bot.clients import BotResponse
+from quiz_bot.clients.telegram_async import AsyncRemoteBotClient
+from quiz_bot.entity import ContextUser, RemoteClientSettings
+from quiz_bot.quiz import QuizInterface
+from quiz_bot.quiz.interfaces import AsyncQuizInterface
+from quiz_bot.quiz.interfaces.quiz_interface import ResponseFunc
+from tests.fake_bot_api import FakeBotApi
+from tests.replay_client import make_message_update
+
+_THREADS_NUM = 2
+_CHATS_AMOUNT = 10
+
+
+class BlockingInterface:
+    """ Makes response only when all chats are processed at once, like with slow shoutbox. """
+
+    def __init__(self, parties: int) -> None:
+        self._barrier = threading.Barrier(parties, timeout=5)
+
+    def get_message_func(self, message: telebot.types.Message) -> ResponseFunc:
+        return self._reply
+
+    @staticmethod
+    def _reply(message: telebot.types.Message) -> BotResponse:
+        chat_id = message.chat.id
+        user = ContextUser(id=chat_id, external_id=chat_id, remote_chat_id=chat_id, chitchat_id=str(chat_id))
+        return BotResponse(user=user, user_message=message.text, reply=message.text)
+
+    def make_response(self, message: telebot.types.Message, func: ResponseFunc) -> BotResponse:
+        self._barrier.wait()
+        return func(message)
+
+
+def test_updates_are_processed_beyond_threads_num() -> None:
+    async def run(api: FakeBotApi) -> None:
+        await api.start()
+        settings = RemoteClientSettings(
+            token='token', api_url=api.url, threads_num=_THREADS_NUM, send_rate_limit=1000, chat_send_rate_limit=1000
+        )
+        client = AsyncRemoteBotClient(settings)
+        interface = AsyncQuizInterface(
+            client=client, interface=cast(QuizInterface, BlockingInterface(_CHATS_AMOUNT)), settings=settings
+        )
+        try:
+            async with client:
+                for chat_id in range(1, _CHATS_AMOUNT + 1):
+                    interface.dispatch(
+                        telebot.types.Update.de_json(make_message_update(chat_id, chat_id=chat_id, text='/start'))
+                    )
+                assert interface.in_flight == _CHATS_AMOUNT
+                while interface.in_flight:
+                    await asyncio.sleep(0.01)
+        finally:
+            await api.stop()
+
+    api = FakeBotApi()
+    asyncio.run(run(api))
+    chat_ids: List[int] = sorted(chat for _, chat, _ in api.messages)
+    assert chat_ids == list(range(1, _CHATS_AMOUNT + 1))
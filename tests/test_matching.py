@@ -0,0 +1,86 @@
+import pytest
+from quiz_bot.quiz.checkers.matching import AnswerMatcher, has_fuzzy_occurrence
+
+
+@pytest.mark.parametrize('max_distance', [0, 1, 3])
+def test_exact_occurrence_is_found(max_distance: int) -> None:
+    assert has_fuzzy_occurrence('rossum', 'guido van rossum', max_distance)
+
+
+@pytest.mark.parametrize(
+    'text', ['guido van rosum', 'guido van rosssum', 'guido van rozsum'], ids=['deletion', 'insertion', 'substitution']
+)
+def test_one_edit_is_found_only_with_allowed_distance(text: str) -> None:
+    assert has_fuzzy_occurrence('rossum', text, 1)
+    assert not has_fuzzy_occurrence('rossum', text, 0)
+
+
+@pytest.mark.parametrize('max_distance', [1, 2, 3])
+def test_occurrence_is_found_up_to_max_distance(max_distance: int) -> None:
+    pattern = 'abcdefghijkl'
+    for edits in range(max_distance + 1):
+        text = 'xx ' + 'Z' * edits + pattern[edits:] + ' yy'
+        assert has_fuzzy_occurrence(pattern, text, max_distance)
+
+
+@pytest.mark.parametrize('max_distance', [0, 1, 2, 3])
+def test_occurrence_is_not_found_past_max_distance(max_distance: int) -> None:
+    pattern = 'abcdefghijkl'
+    edits = max_distance + 1
+    text = 'xx ' + ''.join('Z' if i % 2 == 0 and i < 2 * edits else x for i, x in enumerate(pattern)) + ' yy'
+    assert not has_fuzzy_occurrence(pattern, text, max_distance)
+
+
+def test_pattern_not_longer_than_max_distance_is_always_found() -> None:
+    assert has_fuzzy_occurrence('ab', 'xyz', 2)
+    assert not has_fuzzy_occurrence('abc', 'xyz', 2)
+
+
+@pytest.mark.parametrize(
+    ('expectation', 'answer', 'matched'),
+    [
+        ('a.b', 'a.b', True),
+        ('a.b', 'axb', False),
+        ('c++', 'i write in c++', True),
+        ('c++', 'i write in cc', False),
+        ('(42)', 'answer is (42)', True),
+        ('(42)', 'answer is 42', False),
+        ('[a-z]', 'x', False),
+        ('$5^2', 'it costs $5^2', True),
+        ('a|b', 'a', False),
+    ],
+)
+def test_expectation_metacharacters_are_matched_literally(expectation: str, answer: str, matched: bool) -> None:
+    assert AnswerMatcher([expectation]).match(answer) is matched
+
+
+def test_any_expectation_is_matched() -> None:
+    matcher = AnswerMatcher(['guido', 'rossum'])
+    assert matcher.match('it is rossum')
+    assert matcher.match('guido!')
+    assert not matcher.match('larry wall')
+
+
+def test_empty_expectations_do_not_match() -> None:
+    assert not AnswerMatcher(['']).match('anything')
+    assert not AnswerMatcher([], max_typos=3).match('')
+
+
+def test_typos_are_allowed_only_with_max_typos() -> None:
+    assert not AnswerMatcher(['rossum']).match('rosum')
+    assert AnswerMatcher(['rossum'], max_typos=1).match('rosum')
+
+
+def test_typos_are_scaled_by_expectation_length() -> None:
+    matcher = AnswerMatcher(['rossum', 'guido van rossum', 'ok'], max_typos=3)
+    assert not matcher.match('rssm')
+    assert not matcher.match('ik')
+    assert matcher.match('gido van rosum')
+    assert matcher.match('gido vn rosum')
+    assert not matcher.match('gido vn rsum zz')
+
+
+def test_punctuation_is_ignored_for_typos() -> None:
+    matcher = AnswerMatcher(['guido van rossum'], max_typos=1)
+    assert matcher.match('guido, van rosum!')
+    assert not matcher.match('guido, va rosum!')
@@ -0,0 +1,80 @@
+import os
+import signal
+import time
+from typing import Dict, Iterable, List, Sequence
+
+import pytest
+from quiz_bot.cli.utils import handle_termination
+from quiz_bot.entity import ContextMessage, MessageBufferSettings
+from quiz_bot.storage import BufferedMessageStorage, IMessageStorage
+
+
+class MemoryMessageStorage(IMessageStorage):
+    def __init__(self) -> None:
+        self.saved: List[str] = []
+
+    def save(self, text: str) -> None:
+        self.save_all([text])
+
+    def save_all(self, texts: Sequence[str]) -> None:
+        self.saved.extend(texts)
+
+    @property
+    def messages(self) -> Iterable[ContextMessage]:
+        return [ContextMessage(text=x) for x in self.saved]
+
+    @property
+    def word_frequencies(self) -> Dict[str, int]:
+        return {}
+
+    @property
+    def recent_word_frequencies(self) -> Dict[str, int]:
+        return {}
+
+
+@pytest.fixture()
+def storage() -> MemoryMessageStorage:
+    return MemoryMessageStorage()
+
+
+@pytest.fixture()
+def buffered_storage(storage: MemoryMessageStorage) -> BufferedMessageStorage:
+    return BufferedMessageStorage(storage, settings=MessageBufferSettings(flush_size=1000, flush_interval=60))
+
+
+def test_buffered_messages_are_saved_on_close(
+    storage: MemoryMessageStorage, buffered_storage: BufferedMessageStorage
+) -> None:
+    buffered_storage.save_all(['first', 'second'])
+    buffered_storage.save('third')
+    assert not storage.saved
+    assert buffered_storage.pending == 3
+    buffered_storage.close()
+    assert storage.saved == ['first', 'second', 'third']
+    assert buffered_storage.pending == 0
+
+
+def test_messages_are_saved_right_away_after_close(
+    storage: MemoryMessageStorage, buffered_storage: BufferedMessageStorage
+) -> None:
+    buffered_storage.close()
+    buffered_storage.save_all(['late'])
+    assert storage.saved == ['late']
+
+
+def test_buffered_messages_are_saved_on_sigterm(
+    storage: MemoryMessageStorage, buffered_storage: BufferedMessageStorage
+) -> None:
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    handle_termination()
+    try:
+        buffered_storage.save_all(['first', 'second'])
+        with pytest.raises(SystemExit):
+            try:
+                os.kill(os.getpid(), signal.SIGTERM)
+                time.sleep(5)
+            finally:
+                buffered_storage.close()
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+    assert storage.saved == ['first', 'second']
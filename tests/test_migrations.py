@@ -0,0 +1,145 @@
+import os
+import uuid
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy_utils as sau
+from click.testing import CliRunner
+from quiz_bot.cli import app
+from quiz_bot.db import migrations
+from quiz_bot.db.base import metadata
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL, make_url
+
+# Reverts migrations on schema created from the models, so the database looks like one of the first versions
+_LEGACY_SCHEMA_STATEMENTS = [
+    "DROP TABLE schema_versions",
+    "DROP TABLE word_frequencies",
+    "DROP INDEX ix_messages_created_at",
+    "ALTER TABLE participants DROP COLUMN current_phase, DROP COLUMN current_result_id",
+    "DROP INDEX ix_challenges_actual",
+    "ALTER TABLE results DROP CONSTRAINT uq_results_participant_id_phase",
+    "DROP INDEX ix_participants_pretenders",
+    "DROP INDEX ix_participants_challenge_id_scores",
+    "ALTER TABLE participants DROP CONSTRAINT uq_participants_user_id_challenge_id",
+    "ALTER TABLE users DROP CONSTRAINT uq_users_external_id",
+]
+
+_DUPLICATES = """
+INSERT INTO users (id, external_id, remote_chat_id, chitchat_id) VALUES (1, 100, 100, 'a'), (2, 100, 100, 'b'),
+    (3, 200, 200, 'c');
+INSERT INTO challenges (id, name, phase_amount, winner_amount, duration) VALUES (1, 'c1', 3, 1, interval '1 day');
+INSERT INTO participants (id, user_id, challenge_id, scores, finished_at) VALUES (1, 1, 1, 1, NULL),
+    (2, 2, 1, 2, NULL), (3, 3, 1, 0, NULL), (4, 3, 1, 0, now());
+INSERT INTO results (id, participant_id, phase) VALUES (1, 1, 1), (2, 1, 2), (3, 2, 1), (4, 2, 2), (5, 2, 2),
+    (6, 3, 1), (7, 4, 1);
+"""
+
+SchemaState = Dict[str, Tuple[Any, ...]]
+
+
+@pytest.fixture()
+def db_url() -> Iterator[URL]:
+    test_db_url = os.environ.get('TEST_DB_URL')
+    if test_db_url is None:
+        pytest.skip("Migration tests require PostgreSQL database URL in TEST_DB_URL")
+    url = make_url(test_db_url)
+    url.database = f'quiz_bot_test_{uuid.uuid4().hex}'
+    sau.create_database(url)
+    try:
+        yield url
+    finally:
+        sau.drop_database(url)
+
+
+@pytest.fixture()
+def engine(db_url: URL) -> Iterator[Engine]:
+    engine = sa.create_engine(db_url)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture()
+def legacy_engine(engine: Engine) -> Engine:
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        for statement in _LEGACY_SCHEMA_STATEMENTS:
+            connection.execute(sa.text(statement))
+    return engine
+
+
+def _run_db_command(db_url: URL, command: str) -> str:
+    result = CliRunner().invoke(app, ['db', command], env={'DB_URL': str(db_url)})
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def _get_schema_state(engine: Engine) -> SchemaState:
+    inspector = sa.inspect(engine)
+    state: SchemaState = {}
+    for table in sorted(inspector.get_table_names()):
+        state[table] = (
+            sorted((x['name'], str(x['type']), x['nullable']) for x in inspector.get_columns(table)),
+            sorted(x['name'] for x in inspector.get_unique_constraints(table)),
+            sorted(x['name'] for x in inspector.get_indexes(table)),
+            sorted(x['name'] for x in inspector.get_foreign_keys(table)),
+        )
+    return state
+
+
+def _get_rows(engine: Engine, statement: str) -> List[Tuple[Any, ...]]:
+    return [tuple(x) for x in engine.execute(statement)]
+
+
+def test_upgrade_creates_schema_of_empty_database(db_url: URL, engine: Engine) -> None:
+    _run_db_command(db_url, 'upgrade')
+
+    assert migrations.get_version(engine) == migrations.MIGRATIONS[-1].version
+    assert set(sa.inspect(engine).get_table_names()) == set(metadata.tables)
+
+
+def test_upgraded_schema_is_equal_to_created_one(db_url: URL, legacy_engine: Engine) -> None:
+    _run_db_command(db_url, 'upgrade')
+    upgraded = _get_schema_state(legacy_engine)
+
+    legacy_engine.execute(
+        sa.text("; ".join(f'DROP TABLE IF EXISTS "{x}" CASCADE' for x in sa.inspect(legacy_engine).get_table_names()))
+    )
+    _run_db_command(db_url, 'create-all')
+
+    assert _get_schema_state(legacy_engine) == upgraded
+
+
+def test_upgrade_rerun_changes_nothing(db_url: URL, legacy_engine: Engine) -> None:
+    legacy_engine.execute(_DUPLICATES)
+    first_output = _run_db_command(db_url, 'upgrade')
+    schema = _get_schema_state(legacy_engine)
+    versions = _get_rows(legacy_engine, 'SELECT version, applied_at FROM schema_versions ORDER BY version')
+
+    second_output = _run_db_command(db_url, 'upgrade')
+
+    assert 'Applied migration' in first_output
+    assert 'Applied migration' not in second_output
+    assert _get_schema_state(legacy_engine) == schema
+    assert _get_rows(legacy_engine, 'SELECT version, applied_at FROM schema_versions ORDER BY version') == versions
+
+
+def test_upgrade_keeps_first_user_and_most_advanced_participation(db_url: URL, legacy_engine: Engine) -> None:
+    legacy_engine.execute(_DUPLICATES)
+
+    _run_db_command(db_url, 'upgrade')
+
+    assert _get_rows(legacy_engine, 'SELECT id, external_id FROM users ORDER BY id') == [(1, 100), (3, 200)]
+    # Participation with more scores is kept, with equal scores the finished one
+    assert _get_rows(
+        legacy_engine, 'SELECT id, user_id, scores, current_phase, current_result_id FROM participants ORDER BY id'
+    ) == [(2, 1, 2, 2, 4), (4, 3, 0, 1, 7)]
+    # The first result of every phase is kept
+    assert _get_rows(legacy_engine, 'SELECT id, participant_id, phase FROM results ORDER BY id') == [
+        (3, 2, 1),
+        (4, 2, 2),
+        (7, 4, 1),
+    ]
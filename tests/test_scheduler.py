@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Callable, List, Tuple
+
+import pytest
+import requests
+import telebot
+from quiz_bot.clients.scheduler import SendPriority, SendScheduler
+from quiz_bot.entity import RemoteClientSettings
+
+_RETRY_AFTER = 0.5
+
+
+def _make_scheduler(**settings: float) -> SendScheduler:
+    options = dict(send_workers=4, send_rate_limit=1000, chat_send_rate_limit=1000, chat_send_burst=10)
+    options.update(settings)
+    remote_settings = RemoteClientSettings(token='token', **options)
+    return SendScheduler(remote_settings, rate_limit=remote_settings.send_rate_limit)
+
+
+def _make_flood_error(retry_after: float) -> telebot.apihelper.ApiTelegramException:
+    return telebot.apihelper.ApiTelegramException(
+        'sendMessage',
+        None,
+        {'error_code': 429, 'description': 'Too Many Requests', 'parameters': {'retry_after': retry_after}},
+    )
+
+
+class CallRecorder:
+    """ Records made calls, every call fails with specified errors first. """
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+
+    def make_call(self, name: str, *errors: Exception) -> Callable[[], None]:
+        pending = list(errors)
+
+        def call() -> None:
+            if pending:
+                raise pending.pop(0)
+            with self._lock:
+                self.calls.append((time.monotonic() - self._started_at, name))
+
+        return call
+
+    @property
+    def names(self) -> List[str]:
+        return [name for _, name in self.calls]
+
+    def get_time(self, name: str) -> float:
+        return next(sent_at for sent_at, x in self.calls if x == name)
+
+
+def test_flood_waits_for_retry_after() -> None:
+    scheduler = _make_scheduler()
+    recorder = CallRecorder()
+    scheduler.submit(1, [recorder.make_call('a', _make_flood_error(_RETRY_AFTER))], SendPriority.INTERACTIVE).result()
+    assert recorder.names == ['a']
+    assert recorder.get_time('a') >= _RETRY_AFTER
+    assert scheduler.metrics.throttled == 1
+    assert scheduler.metrics.sent == 1
+
+
+def test_flood_pauses_only_its_chat() -> None:
+    scheduler = _make_scheduler()
+    recorder = CallRecorder()
+    flooded = scheduler.submit(
+        1, [recorder.make_call('flooded', _make_flood_error(_RETRY_AFTER))], SendPriority.INTERACTIVE
+    )
+    time.sleep(0.05)
+    scheduler.submit(2, [recorder.make_call('other')], SendPriority.INTERACTIVE).result()
+    flooded.result()
+    assert recorder.names == ['other', 'flooded']
+    assert recorder.get_time('other') < _RETRY_AFTER
+
+
+@pytest.mark.parametrize(
+    'error', [_make_flood_error(0.1), requests.ConnectionError("Connection reset")], ids=['flood', 'connection']
+)
+def test_chat_order_is_kept_under_retries(error: Exception) -> None:
+    scheduler = _make_scheduler()
+    recorder = CallRecorder()
+    futures = [
+        scheduler.submit(1, [recorder.make_call('a1', error), recorder.make_call('a2')], SendPriority.INTERACTIVE),
+        scheduler.submit(1, [recorder.make_call('b', error)], SendPriority.BROADCAST),
+        scheduler.submit(1, [recorder.make_call('c')], SendPriority.INTERACTIVE),
+    ]
+    for future in futures:
+        future.result()
+    assert recorder.names == ['a1', 'a2', 'b', 'c']
+
+
+def test_flood_fails_after_attempts() -> None:
+    scheduler = _make_scheduler(send_attempts=2)
+    recorder = CallRecorder()
+    error = _make_flood_error(0)
+    future = scheduler.submit(1, [recorder.make_call('a', error, error)], SendPriority.INTERACTIVE)
+    with pytest.raises(telebot.apihelper.ApiTelegramException):
+        future.result()
+    assert not recorder.calls
+    assert scheduler.metrics.failed == 1
@@ -0,0 +1,83 @@
+import http
+import socket
+import threading
+import time
+from typing import List, Optional
+
+import pydantic
+import pytest
+import telebot
+from quiz_bot.clients.webhook import WebhookServer
+from quiz_bot.entity import RemoteClientSettings
+from tests.replay_client import WebhookReplayClient
+
+_SECRET = 'secret'
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return int(sock.getsockname()[1])
+
+
+@pytest.fixture(scope='module')
+def settings() -> RemoteClientSettings:
+    return RemoteClientSettings(
+        token='token',
+        webhook_url='https://quiz.example.org/telegram',
+        webhook_host='127.0.0.1',
+        webhook_port=_get_free_port(),
+        webhook_secret=_SECRET,
+    )
+
+
+@pytest.fixture(scope='module')
+def updates(settings: RemoteClientSettings) -> List[telebot.types.Update]:
+    received: List[telebot.types.Update] = []
+    server = WebhookServer(settings, callback=received.extend)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    for _ in range(50):
+        try:
+            socket.create_connection((settings.webhook_host, settings.webhook_port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.1)
+    return received
+
+
+def _make_client(settings: RemoteClientSettings, secret: Optional[str]) -> WebhookReplayClient:
+    return WebhookReplayClient(f'http://{settings.webhook_host}:{settings.webhook_port}', secret=secret)
+
+
+def test_update_is_accepted(settings: RemoteClientSettings, updates: List[telebot.types.Update]) -> None:
+    client = _make_client(settings, secret=_SECRET)
+    update = client.make_message_update(chat_id=1, text='/start')
+    assert client.replay(update, path=settings.webhook_path) == http.HTTPStatus.OK
+    assert updates[-1].update_id == update['update_id']
+    assert updates[-1].message.text == '/start'
+
+
+@pytest.mark.parametrize('secret', [None, 'wrong'])
+def test_update_without_secret_is_rejected(
+    settings: RemoteClientSettings, updates: List[telebot.types.Update], secret: Optional[str]
+) -> None:
+    client = _make_client(settings, secret=secret)
+    count = len(updates)
+    assert client.replay(client.make_message_update(chat_id=1, text='/start'), path=settings.webhook_path) == (
+        http.HTTPStatus.FORBIDDEN
+    )
+    assert len(updates) == count
+
+
+def test_update_with_unknown_path_is_rejected(
+    settings: RemoteClientSettings, updates: List[telebot.types.Update]
+) -> None:
+    client = _make_client(settings, secret=_SECRET)
+    assert client.replay(client.make_message_update(chat_id=1, text='/start'), path='/unknown') == (
+        http.HTTPStatus.NOT_FOUND
+    )
+
+
+def test_webhook_requires_secret() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        RemoteClientSettings(token='token', webhook_url='https://quiz.example.org/telegram')